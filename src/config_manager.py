@@ -77,11 +77,15 @@ class AppConfig:
         return True
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GlobalSettings:
     """
     Global settings for the tester.
-    
+
+    Frozen with __slots__: field access goes through C-level slot
+    descriptors and instances carry no per-instance __dict__. Use
+    dataclasses.replace() to derive modified settings.
+
     Attributes:
         screenshot_on_error: Take screenshot when error occurs
         screenshot_interval: Interval for periodic screenshots (seconds, 0=disabled)
@@ -6,12 +6,7 @@ Provides graphical user interface using customtkinter.
 
 import sys
 import tkinter
-from .main_window import MainWindow
-from .devices_view import DevicesView
-from .apps_view import AppsView
-from .config_view import ConfigView
-from .test_view import TestView
-from .report_view import ReportView
+from .main_window import MainWindow, run_gui
 
 __all__ = [
     'MainWindow',
@@ -23,8 +18,21 @@ __all__ = [
     'run_gui'
 ]
 
+# View classes are resolved lazily (PEP 562) so importing run_gui doesn't
+# pay the widget-module import cost for views the user may never open
+_VIEW_MODULES = {
+    'DevicesView': 'devices_view',
+    'AppsView': 'apps_view',
+    'ConfigView': 'config_view',
+    'TestView': 'test_view',
+    'ReportView': 'report_view',
+}
 
-def run_gui():
-    """Run GUI application."""
-    app = MainWindow()
-    app.mainloop()
\ No newline at end of file
+
+def __getattr__(name):
+    module_name = _VIEW_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    module = importlib.import_module(f'.{module_name}', __name__)
+    return getattr(module, name)
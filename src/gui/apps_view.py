@@ -9,6 +9,7 @@ from typing import Optional, List
 
 from ..config_manager import ConfigManager, AppConfig
 from .base_view import BaseView
+from .styles import make_button
 
 from ..utils.logger import get_logger
 
@@ -226,13 +227,12 @@ class AppsView(BaseView):
             )
             edit_btn.pack(side="right", padx=5, pady=20)
             
-            delete_btn = ctk.CTkButton(
+            delete_btn = make_button(
                 app_frame,
+                'danger',
                 text="Delete",
                 command=lambda a=app: self._delete_app(a),
-                width=60,
-                fg_color="#DC3545",
-                hover_color="#BB2D3B"
+                width=60
             )
             delete_btn.pack(side="right", padx=5, pady=20)
 
@@ -304,13 +304,12 @@ class AppsView(BaseView):
                 info_label.pack(side="left", padx=10, pady=10)
                 
                 # Add button
-                add_btn = ctk.CTkButton(
+                add_btn = make_button(
                     app_frame,
+                    'accent',
                     text="+ Add to Test",
                     command=lambda a=app_info: self._add_installed_app(a),
-                    width=100,
-                    fg_color="#2CC985",
-                    hover_color="#1FA868"
+                    width=100
                 )
                 add_btn.pack(side="right", padx=10, pady=20)
 
@@ -414,13 +413,12 @@ class AppsView(BaseView):
         save_btn.pack(pady=20)
         
         # Cancel button
-        cancel_btn = ctk.CTkButton(
+        cancel_btn = make_button(
             dialog,
+            'neutral',
             text="Cancel",
             command=dialog.destroy,
-            width=100,
-            fg_color="#888888",
-            hover_color="#666666"
+            width=100
         )
         cancel_btn.pack(pady=5)
     
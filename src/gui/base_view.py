@@ -8,10 +8,30 @@ Provides common functionality for all GUI views including:
 - UI building helpers
 """
 
+import functools
+
 import customtkinter as ctk
 from typing import Optional
 
 
+@functools.lru_cache(maxsize=32)
+def get_cached_font(size: int, weight: str = "normal") -> ctk.CTkFont:
+    """
+    Return a shared CTkFont instance, creating it on first request.
+
+    One Tk font object exists per (size, weight) across the whole GUI.
+    Must only be called from the Tk thread, after the root window exists.
+
+    Args:
+        size: Font size in points
+        weight: Font weight ("normal" or "bold")
+
+    Returns:
+        Cached CTkFont instance
+    """
+    return ctk.CTkFont(size=size, weight=weight)
+
+
 class BaseView(ctk.CTkFrame):
     """
     Base class for all GUI views.
@@ -42,6 +62,10 @@ class BaseView(ctk.CTkFrame):
         super().__init__(parent)
         self.main_window = main_window
 
+        # Pre-bind the status callback once so per-call updates skip the
+        # hasattr check and attribute chain through main_window
+        self._status = getattr(main_window, '_update_status', None) or (lambda message: None)
+
         # Call lifecycle hooks
         self._setup_state()
         self._build_ui()
@@ -89,11 +113,12 @@ class BaseView(ctk.CTkFrame):
         """
         Update main window status bar message.
 
+        Hot paths may call the pre-bound self._status directly.
+
         Args:
             message: Status message to display
         """
-        if hasattr(self.main_window, '_update_status'):
-            self.main_window._update_status(message)
+        self._status(message)
 
     def _build_title(self, text: str, font_size: int = 20) -> ctk.CTkLabel:
         """
@@ -109,7 +134,7 @@ class BaseView(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             self,
             text=text,
-            font=ctk.CTkFont(size=font_size, weight="bold")
+            font=get_cached_font(font_size, "bold")
         )
         title_label.pack(pady=(20, 10))
         return title_label
@@ -196,12 +221,17 @@ class BaseView(ctk.CTkFrame):
 
         def bind_to_widget(w):
             """Recursively bind mouse wheel to widget and all its children."""
-            try:
-                w.bind("<MouseWheel>", on_mousewheel, add="+")
-                w.bind("<Button-4>", on_mousewheel_linux_up, add="+")
-                w.bind("<Button-5>", on_mousewheel_linux_down, add="+")
-            except Exception:
-                pass
+            # Sentinel keeps rebinding idempotent: already-bound widgets are
+            # skipped (binding again with add="+" would stack duplicate
+            # handlers), only newly created children get fresh bindings.
+            if not getattr(w, '_mousewheel_bound', False):
+                try:
+                    w.bind("<MouseWheel>", on_mousewheel, add="+")
+                    w.bind("<Button-4>", on_mousewheel_linux_up, add="+")
+                    w.bind("<Button-5>", on_mousewheel_linux_down, add="+")
+                    w._mousewheel_bound = True
+                except Exception:
+                    pass
 
             # Bind to all children recursively
             try:
@@ -215,9 +245,12 @@ class BaseView(ctk.CTkFrame):
 
         # Also bind to the internal canvas
         try:
-            widget._parent_canvas.bind("<MouseWheel>", on_mousewheel, add="+")
-            widget._parent_canvas.bind("<Button-4>", on_mousewheel_linux_up, add="+")
-            widget._parent_canvas.bind("<Button-5>", on_mousewheel_linux_down, add="+")
+            canvas = widget._parent_canvas
+            if not getattr(canvas, '_mousewheel_bound', False):
+                canvas.bind("<MouseWheel>", on_mousewheel, add="+")
+                canvas.bind("<Button-4>", on_mousewheel_linux_up, add="+")
+                canvas.bind("<Button-5>", on_mousewheel_linux_down, add="+")
+                canvas._mousewheel_bound = True
         except Exception:
             pass
 
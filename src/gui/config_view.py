@@ -8,7 +8,11 @@ import customtkinter as ctk
 from typing import Optional, List
 
 from ..config_manager import ConfigManager, GlobalSettings
-from .base_view import BaseView
+from .base_view import BaseView, get_cached_font
+from .styles import make_button
+
+# Constant widget kwargs, built once at import instead of per view instance
+_ACTION_BTN_KW = dict(width=130, height=35)
 
 
 class ConfigView(BaseView):
@@ -59,24 +63,21 @@ class ConfigView(BaseView):
         button_container.pack(fill="both", expand=True, padx=10, pady=10)
 
         # Save button
-        save_btn = ctk.CTkButton(
+        save_btn = make_button(
             button_container,
             text="💾 Save",
             command=self._save_settings,
-            width=130,
-            height=35
+            **_ACTION_BTN_KW
         )
         save_btn.pack(side="left", padx=5, pady=5)
 
         # Reset button
-        reset_btn = ctk.CTkButton(
+        reset_btn = make_button(
             button_container,
+            'danger',
             text="🔄 Reset",
             command=self._reset_settings,
-            width=130,
-            height=35,
-            fg_color="#DC3545",
-            hover_color="#BB2D3B"
+            **_ACTION_BTN_KW
         )
         reset_btn.pack(side="left", padx=5, pady=5)
     
@@ -120,32 +121,35 @@ class ConfigView(BaseView):
             height=60
         )
         setting_frame.pack(fill="x", pady=5, padx=5)
-        setting_frame.pack_propagate(False)
-        
+        # Grid resolves the row in one pass instead of re-scanning
+        # siblings for each sided pack()
+        setting_frame.grid_propagate(False)
+        setting_frame.grid_columnconfigure(0, weight=1)
+
         # Label
         label_widget = ctk.CTkLabel(
             setting_frame,
             text=label,
-            font=ctk.CTkFont(size=14),
+            font=get_cached_font(14),
             width=300,
             anchor="w"
         )
-        label_widget.pack(side="left", padx=10, pady=20)
-        
+        label_widget.grid(row=0, column=0, sticky="w", padx=10, pady=20)
+
         # Entry widget
         if setting_type == "bool":
             # Don't pass text to CTkSwitch to avoid issues
             entry = ctk.CTkSwitch(setting_frame)
             if value:
                 entry.select()
-            entry.pack(side="right", padx=10, pady=15)
+            entry.grid(row=0, column=1, sticky="e", padx=10, pady=15)
         else:
             entry = ctk.CTkEntry(
                 setting_frame,
                 width=200
             )
             entry.insert(0, str(value))
-            entry.pack(side="right", padx=10, pady=15)
+            entry.grid(row=0, column=1, sticky="e", padx=10, pady=15)
         
         self.entries[label] = (entry, setting_type)
     
@@ -182,28 +186,9 @@ class ConfigView(BaseView):
             delay_between_apps = self._get_setting_value("Delay Between Apps (seconds)")
             if delay_between_apps is None:
                 delay_between_apps = 5
-            
-            # Ensure correct types
-            if not isinstance(screenshot_on_error, bool):
-                screenshot_on_error = bool(screenshot_on_error)
-            if not isinstance(screenshot_interval, int):
-                try:
-                    screenshot_interval = int(screenshot_interval)
-                except (ValueError, TypeError):
-                    screenshot_interval = 30
-            if not isinstance(collect_logcat, bool):
-                collect_logcat = bool(collect_logcat)
-            if not isinstance(max_test_retries, int):
-                try:
-                    max_test_retries = int(max_test_retries)
-                except (ValueError, TypeError):
-                    max_test_retries = 3
-            if not isinstance(delay_between_apps, int):
-                try:
-                    delay_between_apps = int(delay_between_apps)
-                except (ValueError, TypeError):
-                    delay_between_apps = 5
-            
+
+            # _get_setting_value already dispatches on the widget type and
+            # returns bool/int/str as appropriate; no re-coercion needed.
             # Create settings object
             new_settings = GlobalSettings(
                 screenshot_on_error=screenshot_on_error,
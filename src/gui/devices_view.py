@@ -4,10 +4,13 @@ Devices View for GUI
 Displays and manages connected Android devices.
 """
 
+import asyncio
+
 import customtkinter as ctk
+from functools import partial
 from typing import Optional, List, Callable
 
-from ..device_manager import DeviceInfo, DeviceManager
+from ..device_manager import DeviceInfo, DeviceManager, get_device_manager
 from .base_view import BaseView
 
 
@@ -39,6 +42,7 @@ class DevicesView(BaseView):
     def _setup_state(self):
         """Initialize devices view state."""
         self.selected_device: Optional[DeviceInfo] = None
+        self._devices_fingerprint = None
 
     def _build_ui(self):
         """Build devices view UI."""
@@ -70,17 +74,59 @@ class DevicesView(BaseView):
         self.info_label.pack(expand=True, pady=20)
     
     def _load_data(self):
-        """Load and display connected devices."""
+        """Kick off a device scan on the background asyncio loop."""
+        if not self.device_manager:
+            self._render_devices([])
+            return
+
+        # The adb listing blocks on a subprocess; run it off the Tk
+        # thread so the window stays responsive while scanning
+        self.update_status("Scanning for devices...")
+        self.main_window.run_async(
+            asyncio.to_thread(self.device_manager.list_devices),
+            on_done=self._on_devices_scanned
+        )
+
+    def _on_devices_scanned(self, future):
+        """Handle a finished device scan (called on the Tk thread)."""
+        if not self.winfo_exists():
+            return
+        try:
+            devices = future.result()
+        except Exception as e:
+            self.update_status(f"Device scan failed: {e}")
+            return
+        self._render_devices(devices)
+
+    def _render_devices(self, devices: List[DeviceInfo]):
+        """Display scanned devices, skipping unchanged re-renders."""
+        # Skip the Tk re-render entirely when the device set is unchanged —
+        # the common case on rapid Refresh clicks
+        fingerprint = tuple(
+            (d.serial, d.model, d.android_version) for d in devices
+        )
+        if fingerprint == self._devices_fingerprint:
+            self.update_status(f"Found {len(devices)} device(s) (unchanged)")
+            return
+        self._devices_fingerprint = fingerprint
+
+        # Unmap the list while rebuilding so each pack() below doesn't
+        # trigger its own geometry pass; re-packed once at the end.
+        self.devices_frame.pack_forget()
+        try:
+            self._populate_devices(devices)
+        finally:
+            self.devices_frame.pack(
+                fill="both", expand=True, padx=10, pady=10,
+                before=self.info_frame
+            )
+
+    def _populate_devices(self, devices: List[DeviceInfo]):
+        """Rebuild the device list rows (devices_frame is unmapped)."""
         # Clear current devices
         for widget in self.devices_frame.winfo_children():
             widget.destroy()
 
-        # Get devices
-        if self.device_manager:
-            devices = self.device_manager.list_devices()
-        else:
-            devices = []
-
         # Display devices
         if not devices:
             no_devices_label = ctk.CTkLabel(
@@ -94,6 +140,10 @@ class DevicesView(BaseView):
 
         for i, device in enumerate(devices, 1):
             device_frame = self._create_item_frame(self.devices_frame)
+            # Grid resolves the row in one pass instead of re-scanning
+            # siblings for each sided pack()
+            device_frame.grid_propagate(False)
+            device_frame.grid_columnconfigure(1, weight=1)
 
             # Device number
             num_label = ctk.CTkLabel(
@@ -102,7 +152,7 @@ class DevicesView(BaseView):
                 font=ctk.CTkFont(size=16, weight="bold"),
                 width=30
             )
-            num_label.pack(side="left", padx=10, pady=10)
+            num_label.grid(row=0, column=0, padx=10, pady=10)
 
             # Device info
             info_text = f"Serial: {device.serial}"
@@ -117,16 +167,16 @@ class DevicesView(BaseView):
                 font=ctk.CTkFont(size=14),
                 anchor="w"
             )
-            info_label.pack(side="left", padx=10, pady=10)
+            info_label.grid(row=0, column=1, sticky="w", padx=10, pady=10)
 
             # Select button
             select_btn = ctk.CTkButton(
                 device_frame,
                 text="Select",
-                command=lambda d=device: self._select_device(d),
+                command=partial(self._select_device, device),
                 width=80
             )
-            select_btn.pack(side="right", padx=10, pady=20)
+            select_btn.grid(row=0, column=2, padx=10, pady=20)
 
         # Rebind mousewheel to include new widgets
         self.rebind_mousewheel(self.devices_frame)
@@ -146,7 +196,6 @@ class DevicesView(BaseView):
         self._update_device_info(device)
         
         # Set device manager in main window (create new DeviceManager with this serial)
-        from ..device_manager import get_device_manager
         new_device_manager = get_device_manager(device.serial)
         if new_device_manager and new_device_manager.connect():
             self.main_window.set_device_manager(new_device_manager)
@@ -4,21 +4,41 @@ Main Window for Android App Auto Tester GUI
 Provides to main application window with navigation.
 """
 
+import asyncio
+import atexit
+import threading
+
 import customtkinter as ctk
+from functools import partial
 from typing import Optional
 
 from ..device_manager import DeviceManager, get_device_manager
 from ..config_manager import get_config_manager
+# Only the default view is imported eagerly; the other views are imported
+# lazily on first navigation to cut GUI cold-start time
+from .base_view import get_cached_font
 from .devices_view import DevicesView
-from .apps_view import AppsView
-from .config_view import ConfigView
-from .test_view import TestView
-from .report_view import ReportView
+from .styles import make_button
 
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Navigation bar spec: (view key, button text, button style kind)
+NAV = [
+    ("devices", "Devices", "primary"),
+    ("apps", "Apps", "primary"),
+    ("config", "Config", "primary"),
+    ("test", "Test", "accent"),
+    ("report", "Report", "primary"),
+]
+
+# Display names for navigable views, keyed by view-cache key
+VIEW_TITLES = {key: text for key, text, _ in NAV}
+
+# Shared nav-button geometry, built once instead of per button
+_NAV_BTN_KW = dict(width=100, height=32)
+
 
 class MainWindow(ctk.CTk):
     """
@@ -45,45 +65,128 @@ class MainWindow(ctk.CTk):
         ctk.set_appearance_mode("dark")
         ctk.set_default_color_theme("blue")
         
-        # Initialize components
-        self.device_manager: Optional[DeviceManager] = get_device_manager()
-        self.config_manager = get_config_manager()
-        
+        # Managers are created lazily via the properties below so the
+        # window paints before any ADB or config-file I/O happens
+        self._device_manager: Optional[DeviceManager] = None
+        self._config_manager = None
+
+
         # Current view
         self.current_view: Optional[ctk.CTkFrame] = None
-        
+        # Error label from a failed view build; cleared on next navigation
+        self._error_label: Optional[ctk.CTkLabel] = None
+
+        # Persistent view cache: views are built on first visit and
+        # re-packed on later visits instead of destroyed/recreated
+        self._view_cache: dict = {}
+        # Views whose cached instance must be rebuilt on next visit
+        # (e.g. after the active device changes)
+        self._stale_views: set = set()
+
+        # Pending coalesced status updates (applied once per idle cycle)
+        self._pending_status: Optional[str] = None
+        self._status_scheduled = False
+        self._pending_device_info = None
+        self._device_status_scheduled = False
+
+
+        # Background asyncio loop so I/O-bound view work (device scans,
+        # filesystem walks) can run without blocking the Tk event loop
+        self._aio_loop = asyncio.new_event_loop()
+        self._aio_thread = threading.Thread(
+            target=self._aio_loop.run_forever,
+            name="gui-asyncio",
+            daemon=True
+        )
+        self._aio_thread.start()
+
         # Build UI
         self._build_ui()
-        
+
+        # Clean shutdown: tear down views and the asyncio loop explicitly
+        # so Tcl commands and the background thread are released
+        self._closing = False
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        atexit.register(self._on_close)
+
         # Load initial view
-        self._show_devices_view()
-    
+        self._show_view("devices")
+
+    def _on_close(self):
+        """Tear down views, the asyncio loop, and the Tk root cleanly."""
+        if self._closing:
+            return
+        self._closing = True
+        try:
+            self._clear_content()
+        except Exception as e:
+            logger.error("Error clearing views during shutdown: %s", e)
+        self._stop_async_loop()
+        try:
+            self.quit()
+            self.destroy()
+        except Exception as e:
+            logger.error("Error destroying window: %s", e)
+
+    @property
+    def device_manager(self) -> Optional[DeviceManager]:
+        """DeviceManager instance, created on first access."""
+        if self._device_manager is None:
+            self._device_manager = get_device_manager()
+        return self._device_manager
+
+    @device_manager.setter
+    def device_manager(self, value: Optional[DeviceManager]):
+        self._device_manager = value
+
+    @property
+    def config_manager(self):
+        """ConfigManager instance, created on first access."""
+        if self._config_manager is None:
+            self._config_manager = get_config_manager()
+        return self._config_manager
+
     def _build_ui(self):
-        """Build main UI layout using pack system."""
+        """Build main UI layout using grid system.
+
+        A single grid (header=row 0, content=row 1, nav=row 2) resolves
+        in one layout pass per resize, instead of the two passes forced
+        by fixed-height pack frames with pack_propagate(False).
+        """
         # Create main frame
         self.main_frame = ctk.CTkFrame(self)
         self.main_frame.pack(fill="both", expand=True, padx=10, pady=10)
-        
+
+        self.main_frame.grid_columnconfigure(0, weight=1)
+        self.main_frame.grid_rowconfigure(1, weight=1)
+        self.main_frame.grid_rowconfigure(2, minsize=60)
+
         # Create header (fixed height at top)
-        self._build_header()
-        
-        # Create navigation FIRST (fixed height at bottom - always visible)
-        self._build_navigation()
-        
-        # Create content area LAST (expands to fill remaining space)
+        header_frame = self._build_header()
+        header_frame.grid(row=0, column=0, sticky="ew", pady=(0, 10))
+
+        # Content area (expands to fill remaining space)
         self.content_frame = ctk.CTkFrame(self.main_frame)
-        self.content_frame.pack(fill="both", expand=True, pady=(10, 0))
+        self.content_frame.grid(row=1, column=0, sticky="nsew")
+
+        # Navigation (fixed height at bottom - always visible)
+        nav_frame = self._build_navigation()
+        nav_frame.grid(row=2, column=0, sticky="ew", pady=(10, 0))
+
+        # Views pack into a single inner container so clearing the content
+        # area is one Tcl destroy call instead of one per child widget
+        self._content_inner = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        self._content_inner.pack(fill="both", expand=True)
     
-    def _build_header(self):
-        """Build header section using pack layout."""
+    def _build_header(self) -> ctk.CTkFrame:
+        """Build header section; the caller grids the returned frame."""
         header_frame = ctk.CTkFrame(self.main_frame)
-        header_frame.pack(fill="x", pady=(0, 10))
-        
+
         # Title
         title_label = ctk.CTkLabel(
             header_frame,
             text="📱 Android App Auto Tester",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=get_cached_font(24, "bold")
         )
         title_label.pack(side="left", padx=20, pady=15)
         
@@ -95,7 +198,7 @@ class MainWindow(ctk.CTk):
         self.device_status_label = ctk.CTkLabel(
             status_container,
             text="Device: Not Connected",
-            font=ctk.CTkFont(size=11),
+            font=get_cached_font(11),
             text_color="#888888"
         )
         self.device_status_label.pack(anchor="e", padx=10, pady=(5, 0))
@@ -104,146 +207,139 @@ class MainWindow(ctk.CTk):
         self.status_label = ctk.CTkLabel(
             status_container,
             text="Ready",
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=get_cached_font(12, "bold")
         )
         self.status_label.pack(anchor="e", padx=10, pady=(0, 5))
-    
-    def _build_navigation(self):
-        """Build navigation bar with fixed height using pack layout."""
+
+        return header_frame
+
+    def _build_navigation(self) -> ctk.CTkFrame:
+        """Build navigation bar; the caller grids the returned frame.
+
+        The fixed height comes from the grid row's minsize, so no
+        pack_propagate(False) second layout pass is needed.
+        """
         nav_frame = ctk.CTkFrame(self.main_frame, height=60)
-        nav_frame.pack(fill="x", side="bottom")
-        nav_frame.pack_propagate(False)  # Prevent frame from shrinking
-        
+
         # Button container for horizontal layout - smaller padding
         button_container = ctk.CTkFrame(nav_frame, fg_color="transparent")
         button_container.pack(fill="both", expand=True, padx=10, pady=2)
         
-        # Navigation buttons
-        self.devices_btn = ctk.CTkButton(
-            button_container,
-            text="Devices",
-            command=self._show_devices_view,
-            width=100,
-            height=32
-        )
-        self.devices_btn.pack(side="left", padx=5, pady=2)
-        
-        self.apps_btn = ctk.CTkButton(
-            button_container,
-            text="Apps",
-            command=self._show_apps_view,
-            width=100,
-            height=32
-        )
-        self.apps_btn.pack(side="left", padx=5, pady=2)
-        
-        self.config_btn = ctk.CTkButton(
-            button_container,
-            text="Config",
-            command=self._show_config_view,
-            width=100,
-            height=32
-        )
-        self.config_btn.pack(side="left", padx=5, pady=2)
-        
-        self.test_btn = ctk.CTkButton(
-            button_container,
-            text="Test",
-            command=self._show_test_view,
-            width=100,
-            height=32,
-            fg_color="#2CC985",  # Green
-            hover_color="#1FA868"
-        )
-        self.test_btn.pack(side="left", padx=5, pady=2)
-        
-        self.report_btn = ctk.CTkButton(
-            button_container,
-            text="Report",
-            command=self._show_report_view,
-            width=100,
-            height=32
-        )
-        self.report_btn.pack(side="left", padx=5, pady=2)
-    
+        # Navigation buttons, generated from the NAV spec
+        self._nav_buttons = {}
+        for key, text, kind in NAV:
+            btn = make_button(
+                button_container,
+                kind,
+                text=text,
+                command=partial(self._show_view, key),
+                **_NAV_BTN_KW
+            )
+            btn.pack(side="left", padx=5, pady=2)
+            self._nav_buttons[key] = btn
+
+        return nav_frame
+
     def _clear_content(self):
-        """Clear the content frame."""
+        """Clear the content area with a single container swap."""
         try:
-            for widget in self.content_frame.winfo_children():
-                widget.destroy()
+            self._content_inner.destroy()
         except Exception as e:
             logger.error(f"Failed to clear content: {e}")
-    
-    def _show_devices_view(self):
-        """Show devices view."""
-        try:
-            self._clear_content()
-            self.current_view = DevicesView(
-                self.content_frame,
-                self.device_manager,
-                self
-            )
-            self.current_view.pack(fill="both", expand=True)
-            self._update_status("View: Devices")
-        except Exception as e:
-            self._handle_view_error("Devices", e)
-    
-    def _show_apps_view(self):
-        """Show apps view."""
-        try:
-            self._clear_content()
-            self.current_view = AppsView(
-                self.content_frame,
-                self.config_manager,
-                self
-            )
-            self.current_view.pack(fill="both", expand=True)
-            self._update_status("View: Apps")
-        except Exception as e:
-            self._handle_view_error("Apps", e)
-    
-    def _show_config_view(self):
-        """Show config view."""
-        try:
-            self._clear_content()
-            self.current_view = ConfigView(
-                self.content_frame,
-                self.config_manager,
-                self
-            )
-            self.current_view.pack(fill="both", expand=True)
-            self._update_status("View: Config")
-        except Exception as e:
-            self._handle_view_error("Config", e)
-    
-    def _show_test_view(self):
-        """Show test view."""
-        try:
-            self._clear_content()
-            self.current_view = TestView(
-                self.content_frame,
+        self._content_inner = ctk.CTkFrame(self.content_frame, fg_color="transparent")
+        self._content_inner.pack(fill="both", expand=True)
+        self._view_cache.clear()
+        self._stale_views.clear()
+        self.current_view = None
+        # Destroyed with the old container
+        self._error_label = None
+
+    def _hide_current_view(self):
+        """Unmap the current view without destroying it."""
+        if self.current_view is not None:
+            self.current_view.pack_forget()
+            # Drop the reference so a later destroy (stale view, clear)
+            # can't leave current_view pointing at a dead frame
+            self.current_view = None
+
+    def _build_view(self, name: str) -> ctk.CTkFrame:
+        """
+        Build a view instance by name.
+
+        Non-default views are imported lazily here, on first visit.
+
+        Args:
+            name: View key from VIEW_TITLES
+
+        Returns:
+            Newly constructed view frame
+        """
+        if name == "devices":
+            return DevicesView(self._content_inner, self.device_manager, self)
+        if name == "apps":
+            from .apps_view import AppsView
+            return AppsView(self._content_inner, self.config_manager, self)
+        if name == "config":
+            from .config_view import ConfigView
+            return ConfigView(self._content_inner, self.config_manager, self)
+        if name == "test":
+            from .test_view import TestView
+            return TestView(
+                self._content_inner,
                 self.device_manager,
                 self.config_manager,
                 self
             )
-            self.current_view.pack(fill="both", expand=True)
-            self._update_status("View: Test")
-        except Exception as e:
-            self._handle_view_error("Test", e)
-    
-    def _show_report_view(self):
-        """Show report view."""
+        if name == "report":
+            from .report_view import ReportView
+            return ReportView(self._content_inner, self)
+        raise ValueError(f"Unknown view: {name}")
+
+    def _show_view(self, name: str):
+        """
+        Show a view, building it on first visit and reusing it afterwards.
+
+        Destroy/recreate cycles dominate navigation latency and leak Tcl
+        commands, so cached views are only unmapped, never destroyed.
+
+        Args:
+            name: View key from VIEW_TITLES
+        """
+        label = VIEW_TITLES.get(name, name)
         try:
-            self._clear_content()
-            self.current_view = ReportView(
-                self.content_frame,
-                self
-            )
-            self.current_view.pack(fill="both", expand=True)
-            self._update_status("View: Report")
+            self._hide_current_view()
+
+            # Views are only unmapped, never destroyed, so a leftover
+            # error label from a failed build must be removed explicitly
+            if self._error_label is not None:
+                self._error_label.destroy()
+                self._error_label = None
+
+            if name in self._stale_views:
+                stale = self._view_cache.pop(name, None)
+                if stale is not None:
+                    stale.destroy()
+                self._stale_views.discard(name)
+
+            view = self._view_cache.get(name)
+            if view is None:
+                # First visit: paint a placeholder before the (potentially
+                # slow) view construction so the switch feels instant
+                loading = ctk.CTkLabel(self._content_inner, text="Loading…")
+                loading.place(relx=0.5, rely=0.5, anchor="center")
+                self.update_idletasks()
+                try:
+                    view = self._view_cache[name] = self._build_view(name)
+                finally:
+                    loading.place_forget()
+                    loading.destroy()
+            view.pack(fill="both", expand=True)
+            self.current_view = view
+            self._update_status(f"View: {label}")
         except Exception as e:
-            self._handle_view_error("Report", e)
-    
+            self._view_cache.pop(name, None)
+            self._handle_view_error(label, e)
+
     def _handle_view_error(self, view_name: str, error: Exception):
         """
         Handle view loading error.
@@ -252,38 +348,70 @@ class MainWindow(ctk.CTk):
             view_name: Name of the view that failed
             error: Exception that occurred
         """
-        logger.error(f"Failed to load {view_name} view: {error}")
-        import traceback
+        logger.error(f"Failed to load {view_name} view: {error}", exc_info=True)
         self._update_status(f"Error loading {view_name} view")
         
-        # Show error label
-        error_label = ctk.CTkLabel(
-            self.content_frame,
+        # Show error label; keep the reference so the next navigation
+        # can destroy it (see _show_view)
+        if self._error_label is not None:
+            self._error_label.destroy()
+        self._error_label = ctk.CTkLabel(
+            self._content_inner,
             text=f"Failed to load {view_name} View:\n{error}",
             text_color="#DC3545",
-            font=ctk.CTkFont(size=14)
+            font=get_cached_font(14)
         )
-        error_label.pack(fill="both", expand=True, padx=20, pady=20)
+        self._error_label.pack(fill="both", expand=True, padx=20, pady=20)
     
     def _update_status(self, message: str):
         """
         Update to status label.
-        
+
+        Rapid updates are coalesced: only the latest message is written
+        to Tcl, once per idle cycle.
+
         Args:
             message: Status message
         """
+        self._pending_status = message
+        if not self._status_scheduled:
+            self._status_scheduled = True
+            try:
+                self.after_idle(self._flush_status)
+            except Exception as e:
+                self._status_scheduled = False
+                logger.error("Failed to schedule status update: %s", e)
+
+    def _flush_status(self):
+        """Apply the most recent pending status message."""
+        self._status_scheduled = False
         try:
-            self.status_label.configure(text=message)
+            self.status_label.configure(text=self._pending_status)
         except Exception as e:
-            logger.error(f"Failed to update status: {e}")
-    
+            logger.error("Failed to update status: %s", e)
+
     def _update_device_status(self, device_info=None):
         """
         Update to device status label.
-        
+
+        Coalesced like _update_status: one Tcl write per idle cycle.
+
         Args:
             device_info: DeviceInfo or None
         """
+        self._pending_device_info = device_info
+        if not self._device_status_scheduled:
+            self._device_status_scheduled = True
+            try:
+                self.after_idle(self._flush_device_status)
+            except Exception as e:
+                self._device_status_scheduled = False
+                logger.error("Failed to schedule device status update: %s", e)
+
+    def _flush_device_status(self):
+        """Apply the most recent pending device status."""
+        self._device_status_scheduled = False
+        device_info = self._pending_device_info
         try:
             if device_info:
                 self.device_status_label.configure(
@@ -296,8 +424,34 @@ class MainWindow(ctk.CTk):
                     text_color="#888888"
                 )
         except Exception as e:
-            logger.error(f"Failed to update device status: {e}")
+            logger.error("Failed to update device status: %s", e)
     
+    def run_async(self, coro, on_done=None):
+        """
+        Run a coroutine on the background asyncio loop.
+
+        Args:
+            coro: Coroutine to schedule
+            on_done: Optional callable invoked on the Tk thread with the
+                finished concurrent.futures.Future
+
+        Returns:
+            concurrent.futures.Future for the scheduled coroutine
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self._aio_loop)
+        if on_done is not None:
+            # Deliver the result back on the Tk thread
+            future.add_done_callback(lambda f: self.after(0, on_done, f))
+        return future
+
+    def _stop_async_loop(self):
+        """Stop the background asyncio loop if it is still running."""
+        try:
+            if self._aio_loop.is_running():
+                self._aio_loop.call_soon_threadsafe(self._aio_loop.stop)
+        except Exception as e:
+            logger.error(f"Failed to stop asyncio loop: {e}")
+
     def set_device_manager(self, device_manager: DeviceManager):
         """
         Set device manager.
@@ -310,13 +464,21 @@ class MainWindow(ctk.CTk):
             device_info = device_manager.get_device_info()
             self._update_device_status(device_info)
 
+        # Cached views captured the old manager at construction time;
+        # rebuild the device-dependent ones on their next visit
+        self._stale_views.update({"devices", "apps", "test"})
+
 
 def run_gui():
     """Run GUI application."""
+    app = None
     try:
         app = MainWindow()
         app.mainloop()
     except KeyboardInterrupt:
         logger.info("Application interrupted by user")
     except Exception as e:
-        logger.error(f"Fatal error in GUI: {e}", exc_info=True)
\ No newline at end of file
+        logger.error(f"Fatal error in GUI: {e}", exc_info=True)
+    finally:
+        if app is not None:
+            app._stop_async_loop()
\ No newline at end of file
@@ -4,12 +4,26 @@ Report View for GUI
 Displays test reports.
 """
 
+import asyncio
+
 import customtkinter as ctk
+import itertools
+import os
+from datetime import datetime
 from pathlib import Path
+from tkinter import messagebox
 from typing import Optional
 import webbrowser
 
-from .base_view import BaseView
+from .base_view import BaseView, get_cached_font
+from .styles import make_button
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Report file suffixes recognised by the scan and delete passes
+REPORT_SUFFIXES = ('.txt', '.html', '.json')
 
 
 class ReportView(BaseView):
@@ -26,6 +40,14 @@ class ReportView(BaseView):
     def _setup_state(self):
         """Initialize report view state."""
         self.reports_dir = Path("reports")
+        # Scan cache keyed by the directory's mtime; skips re-statting
+        # every file when nothing changed between refreshes
+        self._reports_cache = None
+        self._reports_cache_mtime = -1
+        # Bumped per render; lets pending chunked renders detect staleness
+        self._render_token = 0
+        # Debounce flag: rapid deletes coalesce into one list rebuild
+        self._reload_pending = False
 
     def _build_ui(self):
         """Build report view UI."""
@@ -46,13 +68,12 @@ class ReportView(BaseView):
         refresh_btn.pack(side="left", padx=5, pady=10)
         
         # Delete All button
-        delete_all_btn = ctk.CTkButton(
+        delete_all_btn = make_button(
             buttons_frame,
+            'danger',
             text="🗑 Delete All Reports",
             command=self._delete_all_reports,
-            width=160,
-            fg_color="#DC3545",
-            hover_color="#BB2D3B"
+            width=160
         )
         delete_all_btn.pack(side="right", padx=5, pady=10)
         
@@ -64,77 +85,151 @@ class ReportView(BaseView):
         self._load_reports()
 
     def _load_reports(self):
-        """Load and display test reports."""
+        """Scan for reports in the background, then render on the Tk thread.
+
+        The scan stats every report file, which can block noticeably on
+        slow or network filesystems, so it runs on the main window's
+        background asyncio loop and the result is delivered via after().
+        """
+        self.main_window._update_status("Loading reports…")
+        self.main_window.run_async(
+            asyncio.to_thread(self._scan_reports),
+            on_done=self._on_reports_scanned
+        )
+
+    def _on_reports_scanned(self, future):
+        """Handle a finished report scan (called on the Tk thread)."""
+        if not self.winfo_exists():
+            return
+        try:
+            report_files = future.result()
+        except Exception as e:
+            logger.error(f"Report scan failed: {e}")
+            self.main_window._update_status("Failed to load reports")
+            return
+        self._render_reports(report_files)
+
+    def _scan_reports(self):
+        """Collect (path, stat) pairs for report files (worker thread)."""
+        report_files = None
+        if self.reports_dir.exists():
+            dir_mtime = self.reports_dir.stat().st_mtime_ns
+            if (dir_mtime == self._reports_cache_mtime
+                    and self._reports_cache is not None):
+                # Directory unchanged since the last scan
+                report_files = self._reports_cache
+            else:
+                # One scandir pass, one stat per file (cached on the
+                # DirEntry) instead of three globs and two stats each
+                report_files = []
+                with os.scandir(self.reports_dir) as it:
+                    for entry in it:
+                        if (entry.is_file(follow_symlinks=False)
+                                and entry.name.endswith(REPORT_SUFFIXES)):
+                            report_files.append((Path(entry.path), entry.stat()))
+                report_files.sort(key=lambda item: item[1].st_mtime, reverse=True)
+                self._reports_cache = report_files
+                self._reports_cache_mtime = dir_mtime
+
+        return report_files
+
+    def _render_reports(self, report_files):
+        """Build the report rows (Tk main thread).
+
+        Args:
+            report_files: Sorted (Path, stat_result) pairs, or None when
+                the reports directory does not exist
+        """
         # Clear current reports
         for widget in self.reports_frame.winfo_children():
             widget.destroy()
-        
-        # Check if reports directory exists
-        if not self.reports_dir.exists():
+
+        if report_files is None:
             no_reports_label = ctk.CTkLabel(
                 self.reports_frame,
                 text="No reports found\n\nRun tests to generate reports",
-                font=ctk.CTkFont(size=14)
+                font=get_cached_font(14)
             )
             no_reports_label.pack(pady=20)
             self.main_window._update_status("No reports directory")
             return
-        
-        # Get report files
-        report_files = []
-        for ext in ["*.txt", "*.html", "*.json"]:
-            report_files.extend(sorted(
-                self.reports_dir.glob(ext),
-                key=lambda x: x.stat().st_mtime,
-                reverse=True
-            ))
-        
+
         # Display reports
         if not report_files:
             no_reports_label = ctk.CTkLabel(
                 self.reports_frame,
                 text="No reports found\n\nRun tests to generate reports",
-                font=ctk.CTkFont(size=14)
+                font=get_cached_font(14)
             )
             no_reports_label.pack(pady=20)
             self.main_window._update_status("No reports found")
             return
         
-        for report_file in report_files:
-            report_frame = ctk.CTkFrame(
+        # Render rows in chunks so a large report list doesn't freeze the
+        # UI; the token invalidates pending chunks if a new render starts
+        self._render_token += 1
+        self._render_report_chunk(iter(report_files), len(report_files), self._render_token)
+
+    _RENDER_CHUNK = 20
+
+    def _render_report_chunk(self, entries_iter, total: int, token: int):
+        """Render up to _RENDER_CHUNK report rows, then yield to the UI.
+
+        Args:
+            entries_iter: Iterator over remaining (Path, stat_result) pairs
+            total: Total number of report files (for the status message)
+            token: Render generation; stale chunks are dropped
+        """
+        if token != self._render_token:
+            return
+
+        # Shared fonts for all rows, resolved once outside the loop
+        icon_font = get_cached_font(24)
+        info_font = get_cached_font(14)
+
+        # Local bindings turn per-row module attribute lookups into
+        # LOAD_FAST; measurable across hundreds of widgets
+        CTkFrame = ctk.CTkFrame
+        CTkLabel = ctk.CTkLabel
+        CTkButton = ctk.CTkButton
+
+        for report_file, stat_result in itertools.islice(entries_iter, self._RENDER_CHUNK):
+            # Rows size to their content; pack_propagate(False) would force
+            # an extra geometry pass per row for no visual difference
+            report_frame = CTkFrame(
                 self.reports_frame,
                 height=80
             )
             report_frame.pack(fill="x", pady=5, padx=5)
-            report_frame.pack_propagate(False)
-            
+
             # File icon
             icon = self._get_file_icon(report_file.suffix)
-            icon_label = ctk.CTkLabel(
+            icon_label = CTkLabel(
                 report_frame,
                 text=icon,
-                font=ctk.CTkFont(size=24)
+                font=icon_font
             )
             icon_label.pack(side="left", padx=10, pady=20)
-            
+
             # File info
-            info_text = f"Name: {report_file.name}\n"
-            import time
-            mtime = report_file.stat().st_mtime
-            info_text += f"Modified: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(mtime))}\n"
-            info_text += f"Size: {report_file.stat().st_size} bytes"
-            
-            info_label = ctk.CTkLabel(
+            modified = datetime.fromtimestamp(stat_result.st_mtime)
+            info_text = (
+                f"Name: {report_file.name}\n"
+                f"Modified: {modified.isoformat(' ', 'seconds')}\n"
+                f"Size: {self._fmt_size(stat_result.st_size)}"
+            )
+
+            info_label = CTkLabel(
                 report_frame,
                 text=info_text,
-                font=ctk.CTkFont(size=14),
+                font=info_font,
                 anchor="w"
             )
             info_label.pack(side="left", padx=10, pady=10)
             
             # Buttons
             if report_file.suffix == ".html":
-                preview_btn = ctk.CTkButton(
+                preview_btn = CTkButton(
                     report_frame,
                     text="Preview",
                     command=lambda f=report_file: self._preview_report(f),
@@ -142,7 +237,7 @@ class ReportView(BaseView):
                 )
                 preview_btn.pack(side="right", padx=5, pady=20)
             
-            open_btn = ctk.CTkButton(
+            open_btn = CTkButton(
                 report_frame,
                 text="Open",
                 command=lambda f=report_file: self._open_report(f),
@@ -150,37 +245,62 @@ class ReportView(BaseView):
             )
             open_btn.pack(side="right", padx=5, pady=20)
             
-            delete_btn = ctk.CTkButton(
+            delete_btn = make_button(
                 report_frame,
+                'danger',
                 text="Delete",
                 command=lambda f=report_file: self._delete_report(f),
-                width=60,
-                fg_color="#DC3545",
-                hover_color="#BB2D3B"
+                width=60
             )
             delete_btn.pack(side="right", padx=5, pady=20)
 
+        # More rows left? Continue on the next idle cycle
+        peek = next(entries_iter, None)
+        if peek is not None:
+            self.after_idle(
+                self._render_report_chunk,
+                itertools.chain([peek], entries_iter),
+                total,
+                token
+            )
+            return
+
         # Rebind mousewheel to include new widgets
         self._bind_mousewheel(self.reports_frame)
 
-        self.main_window._update_status(f"Found {len(report_files)} report(s)")
+        self.main_window._update_status(f"Found {total} report(s)")
     
+    # File-type icons keyed by suffix; O(1) lookup per row
+    _ICONS = {".html": "🌐", ".json": "📊"}
+
     def _get_file_icon(self, suffix: str) -> str:
         """
         Get icon for file type.
-        
+
         Args:
             suffix: File suffix (.txt, .html, .json)
-        
+
         Returns:
             Icon string
         """
-        if suffix == ".html":
-            return "🌐"
-        elif suffix == ".json":
-            return "📊"
-        else:
-            return "📄"
+        return self._ICONS.get(suffix, "📄")
+
+    @staticmethod
+    def _fmt_size(size: int) -> str:
+        """
+        Format a byte count as a human-readable size string.
+
+        Args:
+            size: Size in bytes
+
+        Returns:
+            Formatted size (B / KB / MB)
+        """
+        if size < 1024:
+            return f"{size:,} B"
+        if size < 1024 * 1024:
+            return f"{size / 1024:.1f} KB"
+        return f"{size / (1024 * 1024):.1f} MB"
     
     def _preview_report(self, report_file: Path):
         """
@@ -195,15 +315,11 @@ class ReportView(BaseView):
             preview_dialog.title(f"Preview: {report_file.name}")
             preview_dialog.geometry("1000x700")
             
-            # Read HTML content
-            with open(report_file, 'r', encoding='utf-8') as f:
-                html_content = f.read()
-            
             # Create HTML preview (simplified - display as text)
             preview_label = ctk.CTkLabel(
                 preview_dialog,
                 text="HTML Report Preview (Content)",
-                font=ctk.CTkFont(size=14, weight="bold")
+                font=get_cached_font(14, "bold")
             )
             preview_label.pack(pady=(10, 5))
             
@@ -213,9 +329,28 @@ class ReportView(BaseView):
                 font=ctk.CTkFont(family="Consolas", size=10)
             )
             html_text.pack(fill="both", expand=True, padx=10, pady=10)
-            html_text.insert("1.0", html_content)
-            html_text.configure(state="disabled")
-            
+
+            # Stream the file in 64 KB chunks via after_idle so a multi-MB
+            # report shows immediately and the dialog stays interactive.
+            # A single read_text() would be marginally fewer syscalls but
+            # blocks the main thread for the whole file.
+            content = open(report_file, 'r', encoding='utf-8', errors='replace')
+
+            def insert_next_chunk():
+                chunk = content.read(65536)
+                try:
+                    if chunk:
+                        html_text.insert("end", chunk)
+                        preview_dialog.after_idle(insert_next_chunk)
+                        return
+                    html_text.configure(state="disabled")
+                except Exception:
+                    # Dialog closed mid-load
+                    pass
+                content.close()
+
+            insert_next_chunk()
+
             # Close button
             close_btn = ctk.CTkButton(
                 preview_dialog,
@@ -239,11 +374,10 @@ class ReportView(BaseView):
         """
         try:
             if report_file.suffix == ".html":
-                webbrowser.open(f"file://{report_file.absolute()}")
+                webbrowser.open(report_file.resolve(strict=False).as_uri())
             else:
                 # Open with default system application
-                import os
-                os.startfile(str(report_file))
+                os.startfile(os.fspath(report_file))
             self.main_window._update_status(f"Opened: {report_file.name}")
         except Exception as e:
             self.main_window._update_status(f"Error opening report: {e}")
@@ -258,10 +392,25 @@ class ReportView(BaseView):
         try:
             if report_file.exists():
                 report_file.unlink()
-                self._load_reports()
+                self._reports_cache_mtime = -1
+                self._schedule_reload()
                 self.main_window._update_status(f"Deleted: {report_file.name}")
         except Exception as e:
             self.main_window._update_status(f"Error deleting report: {e}")
+
+    def _schedule_reload(self):
+        """Schedule a debounced report list reload.
+
+        Deletes arriving within the debounce window share one rebuild.
+        """
+        if not self._reload_pending:
+            self._reload_pending = True
+            self.after(150, self._do_reload)
+
+    def _do_reload(self):
+        """Run the deferred reload scheduled by _schedule_reload."""
+        self._reload_pending = False
+        self._load_reports()
     
     def _delete_all_reports(self):
         """Delete all report files in the reports directory."""
@@ -270,39 +419,43 @@ class ReportView(BaseView):
             self.main_window._update_status("No reports to delete")
             return
         
-        # Get all report files
-        report_files = []
-        for ext in ["*.txt", "*.html", "*.json"]:
-            report_files.extend(self.reports_dir.glob(ext))
-        
-        if not report_files:
+        # Get all report file paths in one scandir pass
+        with os.scandir(self.reports_dir) as it:
+            targets = [
+                entry.path for entry in it
+                if (entry.is_file(follow_symlinks=False)
+                    and entry.name.endswith(REPORT_SUFFIXES))
+            ]
+
+        if not targets:
             self.main_window._update_status("No reports to delete")
             return
-        
-        # Show confirmation dialog
-        from tkinter import messagebox
-
 
+        # Show confirmation dialog
         confirm = messagebox.askyesno(
             "Delete All Reports",
-            f"Are you sure you want to delete {len(report_files)} report file(s)?\n\nThis action cannot be undone."
+            f"Are you sure you want to delete {len(targets)} report file(s)?\n\nThis action cannot be undone."
         )
-        
+
         if not confirm:
             return
-        
-        # Delete all files
+
+        # Delete all files directly, no Path objects or exists() checks
         deleted_count = 0
         failed_count = 0
-        for report_file in report_files:
+        for path in targets:
             try:
-                report_file.unlink()
+                os.unlink(path)
+                deleted_count += 1
+            except FileNotFoundError:
+                # Already gone — counts as deleted
                 deleted_count += 1
-            except Exception as e:
-                logger.error(f"Failed to delete {report_file.name}: {e}")
+            except OSError as e:
+                logger.error(f"Failed to delete {path}: {e}")
                 failed_count += 1
         
         # Reload and update status
+        self._reports_cache_mtime = -1
         self._load_reports()
         
         if failed_count == 0:
@@ -0,0 +1,35 @@
+"""
+Shared widget styles for GUI views.
+
+Centralizes the button color palettes that were previously repeated as
+literal kwargs in every view. Style dicts are built once at import time,
+so views splat a shared mapping instead of allocating a fresh kwargs
+dict per widget.
+"""
+
+import customtkinter as ctk
+
+# Button color palettes keyed by semantic kind.
+# 'primary' uses the customtkinter theme defaults (no overrides).
+BUTTON_STYLES = {
+    'primary': {},
+    'success': {'fg_color': '#28A745', 'hover_color': '#218838'},
+    'danger': {'fg_color': '#DC3545', 'hover_color': '#BB2D3B'},
+    'accent': {'fg_color': '#2CC985', 'hover_color': '#1FA868'},
+    'neutral': {'fg_color': '#888888', 'hover_color': '#666666'},
+}
+
+
+def make_button(parent, kind: str = 'primary', **overrides) -> ctk.CTkButton:
+    """
+    Create a CTkButton with a shared style palette.
+
+    Args:
+        parent: Parent widget
+        kind: Style kind from BUTTON_STYLES (e.g. 'danger', 'accent')
+        **overrides: Additional CTkButton kwargs (text, command, width, ...)
+
+    Returns:
+        CTkButton widget (not packed)
+    """
+    return ctk.CTkButton(parent, **BUTTON_STYLES[kind], **overrides)
@@ -6,12 +6,15 @@ Runs and monitors automated tests.
 
 import customtkinter as ctk
 from typing import Optional, List
+import queue
 import threading
 
 from ..device_manager import DeviceManager, get_device_manager
 from ..config_manager import ConfigManager, AppConfig, get_global_settings
 from ..report_generator import get_report_generator
-from .base_view import BaseView
+from ..test_engine import get_test_engine
+from .base_view import BaseView, get_cached_font
+from .styles import make_button
 
 from ..utils.logger import get_logger
 
@@ -29,7 +32,7 @@ class TestView(BaseView):
         config_manager: ConfigManager instance
         main_window: Reference to main window
         apps: List of configured apps
-        running: Test running status
+        _stop_event: Set when the user requests tests to stop
     """
     
     def __init__(self, parent, device_manager: Optional[DeviceManager], config_manager: ConfigManager, main_window):
@@ -49,13 +52,21 @@ class TestView(BaseView):
             super().__init__(parent, main_window)
         except Exception as e:
             logger.error(f"Failed to initialize test view: {e}")
-            import traceback
             raise
 
     def _setup_state(self):
         """Initialize test view state."""
         self.apps: List[AppConfig] = []
-        self.running = False
+        self.app_vars: dict = {}
+        # Cooperative stop flag shared with the test-runner thread;
+        # Event is atomic at the C level, unlike a plain bool
+        self._stop_event = threading.Event()
+        # Key of the last rendered app list; unchanged key skips rebuild
+        self._last_apps_key = None
+        # Log/progress updates from the test-runner thread go through this
+        # queue; Tk widgets are only touched by the pump on the main thread
+        self._log_queue = queue.Queue()
+        self._pending_progress = None
 
     def _build_ui(self):
         """Build test view UI using pack layout with fixed bottom buttons."""
@@ -170,26 +181,24 @@ class TestView(BaseView):
             button_container.pack(fill="both", expand=True, padx=10, pady=10)
             
             # Run button
-            self.run_btn = ctk.CTkButton(
+            self.run_btn = make_button(
                 button_container,
+                'success',
                 text="▶️ Run Tests",
                 command=self._run_tests,
                 width=130,
-                height=35,
-                fg_color="#28A745",
-                hover_color="#218838"
+                height=35
             )
             self.run_btn.pack(side="left", padx=5, pady=5)
             
             # Stop button
-            self.stop_btn = ctk.CTkButton(
+            self.stop_btn = make_button(
                 button_container,
+                'danger',
                 text="⏹ Stop",
                 command=self._stop_tests,
                 width=130,
-                height=35,
-                fg_color="#DC3545",
-                hover_color="#BB2D3B"
+                height=35
             )
             self.stop_btn.pack(side="left", padx=5, pady=5)
             self.stop_btn.configure(state="disabled")
@@ -205,20 +214,73 @@ class TestView(BaseView):
             clear_btn.pack(side="left", padx=5, pady=5)
         except Exception as e:
             logger.error(f"Failed to build buttons frame: {e}")
-    
+
+        # Start the queue pump: one Tk redraw per tick instead of per line
+        self.after(50, self._pump_log_queue)
+
     def _log(self, message: str):
         """
-        Add a log message.
-        
+        Queue a log message for the next pump tick.
+
+        Safe to call from any thread.
+
         Args:
             message: Log message
         """
+        self._log_queue.put(message)
+
+    def _set_progress(self, progress: float, text: str):
+        """
+        Record a progress update; applied by the pump on the main thread.
+
+        Coalescing means only the latest value is drawn per tick.
+
+        Args:
+            progress: Progress fraction (0.0 - 1.0)
+            text: Progress label text
+        """
+        self._pending_progress = (progress, text)
+
+    # Keep at most this many lines in the log widget
+    _LOG_MAX_LINES = 5000
+
+    def _pump_log_queue(self):
+        """Drain queued log/progress updates in one batch (main thread)."""
+        # after() still succeeds on a destroyed frame, so without this
+        # check the pump would keep rescheduling forever and pin the
+        # dead view (and its device manager) in memory
+        if not self.winfo_exists():
+            return
+
         try:
-            self.log_text.insert("end", f"{message}\n")
-            self.log_text.see("end")
+            messages = []
+            try:
+                while len(messages) < 200:
+                    messages.append(self._log_queue.get_nowait())
+            except queue.Empty:
+                pass
+
+            if messages:
+                self.log_text.insert("end", "\n".join(messages) + "\n")
+                # Trim oldest lines past the cap; Tk text inserts slow down
+                # as content grows, so keep the buffer bounded
+                lines = int(self.log_text.index('end-1c').split('.')[0])
+                excess = lines - self._LOG_MAX_LINES
+                if excess > 0:
+                    self.log_text.delete('1.0', f'{excess + 1}.0')
+                self.log_text.see("end")
+
+            pending = self._pending_progress
+            if pending is not None:
+                self._pending_progress = None
+                progress, text = pending
+                self.progress_bar.set(progress)
+                self.progress_label.configure(text=text)
         except Exception as e:
-            logger.error(f"Failed to log message: {e}")
-    
+            logger.error("Failed to pump log queue: %s", e)
+
+        self.after(50, self._pump_log_queue)
+
     def _clear_log(self):
         """Clear the log text."""
         try:
@@ -253,7 +315,13 @@ class TestView(BaseView):
             except Exception:
                 pass
             return  # Return early to avoid errors
-        
+
+        # Same apps as last render? Keep existing checkboxes, no Tk churn
+        apps_key = tuple((app.package, app.name) for app in self.apps)
+        if apps_key == self._last_apps_key and self.apps_frame.winfo_children():
+            self._update_device_label()
+            return
+
         # Clear current apps
         try:
             for widget in self.apps_frame.winfo_children():
@@ -275,33 +343,40 @@ class TestView(BaseView):
             return
         
         try:
+            # Shared font and precomputed labels, resolved outside the loop
+            cb_font = get_cached_font(13)
+            labels = [f"{app.name} ({app.package})" for app in self.apps]
+
+            # Local bindings keep per-row class lookups out of the loop
+            BooleanVar = ctk.BooleanVar
+            CTkCheckBox = ctk.CTkCheckBox
+
+            # Checkboxes pack straight into the scrollable frame; a wrapper
+            # frame per row would double the widget count for no visual gain
             self.app_vars = {}
-            for app in self.apps:
-                var = ctk.BooleanVar(value=True)
+            for app, label in zip(self.apps, labels):
+                var = BooleanVar(value=True)
                 self.app_vars[app.package] = var
-                
-                app_frame = ctk.CTkFrame(
+
+                checkbox = CTkCheckBox(
                     self.apps_frame,
-                    height=50
-                )
-                app_frame.pack(fill="x", pady=5, padx=5)
-                app_frame.pack_propagate(False)
-                
-                checkbox = ctk.CTkCheckBox(
-                    app_frame,
-                    text=f"{app.name} ({app.package})",
-                    variable=var
+                    text=label,
+                    variable=var,
+                    font=cb_font
                 )
-                checkbox.pack(side="left", padx=10, pady=15)
+                checkbox.pack(anchor="w", padx=10, pady=4)
 
             # Rebind mousewheel to include new widgets
             if self.apps_frame:
                 self.rebind_mousewheel(self.apps_frame)
+            self._last_apps_key = apps_key
         except Exception as e:
             logger.error(f"Failed to create app checkboxes: {e}")
-            import traceback
-        
-        # Update device status
+
+        self._update_device_label()
+
+    def _update_device_label(self):
+        """Refresh the device status label from the device manager."""
         try:
             if self.device_manager:
                 device_info = self.device_manager.get_device_info()
@@ -319,10 +394,11 @@ class TestView(BaseView):
     def _toggle_select_all(self):
         """Toggle selection of all apps."""
         try:
-            if hasattr(self, 'app_vars'):
-                select_all = self.select_all_var.get()
-                for var in self.app_vars.values():
-                    var.set(select_all)
+            select_all = self.select_all_var.get()
+            for var in self.app_vars.values():
+                var.set(select_all)
+            # One repaint for the whole batch instead of per checkbox
+            self.update_idletasks()
         except Exception as e:
             logger.error(f"Failed to toggle select all: {e}")
     
@@ -348,7 +424,7 @@ class TestView(BaseView):
             return
         
         # Update UI
-        self.running = True
+        self._stop_event.clear()
         self.run_btn.configure(state="disabled")
         self.stop_btn.configure(state="normal")
         self.progress_label.configure(text="Running tests...")
@@ -367,11 +443,6 @@ class TestView(BaseView):
         Args:
             apps: List of apps to test
         """
-        # Lazy import to avoid initialization issues
-        from ..test_engine import get_test_engine
-
-
-        
         results = []
         try:
             # Initialize test engine
@@ -381,14 +452,13 @@ class TestView(BaseView):
             # Run tests
             total = len(apps)
             for i, app in enumerate(apps, 1):
-                if not self.running:
+                if self._stop_event.is_set():
                     self._log("Tests stopped by user")
                     break
                 
-                # Update progress
+                # Update progress (coalesced; drawn by the queue pump)
                 progress = (i - 1) / total
-                self.progress_bar.set(progress)
-                self.progress_label.configure(text=f"Testing {i}/{total}: {app.name}")
+                self._set_progress(progress, f"Testing {i}/{total}: {app.name}")
                 
                 # Run test
                 self._log(f"Testing: {app.name} ({app.package})")
@@ -397,9 +467,8 @@ class TestView(BaseView):
                 self._log(f"Completed: {app.name}")
             
             # Complete
-            if self.running:
-                self.progress_bar.set(1.0)
-                self.progress_label.configure(text="Tests completed!")
+            if not self._stop_event.is_set():
+                self._set_progress(1.0, "Tests completed!")
                 self._log("All tests completed successfully")
                 self.update_status("Tests completed successfully")
                 
@@ -407,12 +476,11 @@ class TestView(BaseView):
                 self._generate_report(results, apps)
             
         except Exception as e:
-            self.progress_label.configure(text=f"Error: {e}")
+            self._set_progress(0.0, f"Error: {e}")
             self._log(f"Error: {e}")
             self.update_status(f"Test error: {e}")
         
         finally:
-            self.running = False
             self.run_btn.configure(state="normal")
             self.stop_btn.configure(state="disabled")
     
@@ -457,7 +525,7 @@ class TestView(BaseView):
     
     def _stop_tests(self):
         """Stop running tests."""
-        self.running = False
+        self._stop_event.set()
         self.progress_label.configure(text="Stopping...")
         self._log("Stopping tests...")
         self.update_status("Stopping tests...")
\ No newline at end of file
@@ -5,7 +5,11 @@ Handles Android log collection and analysis.
 Collects logcat logs, filters errors, and saves to files.
 """
 
+import multiprocessing
+import os
+import queue
 import subprocess
+from collections import Counter, deque
 import re
 import time
 import threading
@@ -20,12 +24,99 @@ from .exceptions import LogCollectionError, LogParseError
 
 logger = get_logger(__name__)
 
+# Compiled once at import; these run on every logcat line, so even the
+# re-internal pattern-cache lookup per call is worth avoiding
+# logcat time format: MM-DD HH:MM:SS.mmm PID  TID  LEVEL TAG: MESSAGE
+# Tight character classes and a bounded tag group keep the NFA from
+# backtracking across the message on malformed lines
+_LOGCAT_LINE_RE = re.compile(
+    r'(\d{2}-\d{2} +\d{2}:\d{2}:\d{2}\.\d{3}) +(\d+) +(\d+) +([VDIWEF]) +([^:\n]{1,64}?): (.*)',
+    re.ASCII  # logcat output is ASCII; skip Unicode-aware \d/\s classes
+)
+# Pattern for package names: com.example.app
+_PACKAGE_RE = re.compile(r'([a-z]+\.[a-z]+\.[a-z]+(?:\.[a-z]+)*)', re.ASCII)
+# Cheap probe for the single-char level field, used to discard filtered
+# lines before paying for the full line regex
+_LEVEL_PROBE_RE = re.compile(r' ([VDIWEF]) ', re.ASCII)
+# Levels that count as errors; shared so is_error never allocates
+_ERROR_LEVELS = frozenset(("E", "F"))
 
-@dataclass
+
+def _format_entry(entry: "LogEntry") -> str:
+    """
+    Render a log entry in the saved-file line format.
+
+    Shared by the streaming and batch save paths so every entry is
+    formatted exactly once.
+
+    Args:
+        entry: Parsed log entry
+
+    Returns:
+        Formatted line including trailing newline
+    """
+    return (
+        f"{entry.timestamp} {entry.pid:5d} {entry.tid:5d} "
+        f"{entry.level} {entry.tag:30s}: {entry.message}\n"
+    )
+
+
+def _analyze_chunk(args) -> tuple:
+    """
+    Tally one byte range of a saved log file (worker process).
+
+    Module-level so multiprocessing can pickle it. A chunk owns the
+    lines that begin inside [start, end); lines are read until one
+    begins at or past end, so a line straddling the boundary belongs
+    to the chunk it starts in.
+
+    Args:
+        args: (path, start, end) byte range
+
+    Returns:
+        (by_level, by_tag) partial Counters
+    """
+    path, start, end = args
+    by_level = Counter()
+    by_tag = Counter()
+
+    with open(path, 'rb') as f:
+        if start:
+            # Skip to the first line that begins at or after start.
+            # Reading from start - 1 consumes the tail of the previous
+            # chunk's last line; when the byte before start is a newline
+            # that read is just the newline itself, so a line beginning
+            # exactly on the boundary is kept rather than dropped.
+            f.seek(start - 1)
+            start = start - 1 + len(f.readline())
+        pos = start
+        while pos < end:
+            raw = f.readline()
+            if not raw:
+                break
+            pos += len(raw)
+
+            parts = raw.decode('utf-8', 'replace').split(None, 5)
+            if len(parts) == 6:
+                level = parts[4]
+                if len(level) == 1 and level in "VDIWEF":
+                    by_level[level] += 1
+                    rest = parts[5]
+                    sep = rest.find(': ')
+                    if sep != -1:
+                        by_tag[rest[:sep].strip()] += 1
+
+    return by_level, by_tag
+
+
+@dataclass(slots=True)
 class LogEntry:
     """
     A single log entry.
-    
+
+    Instances are created per logcat line and can number in the hundreds
+    of thousands; slots halve the per-instance memory footprint.
+
     Attributes:
         timestamp: Log entry timestamp
         pid: Process ID
@@ -57,14 +148,14 @@ class LogEntry:
     
     def is_error(self) -> bool:
         """Check if this log entry is an error."""
-        return self.level in ["E", "F"]
+        return self.level in _ERROR_LEVELS
     
     def is_warning(self) -> bool:
         """Check if this log entry is a warning."""
         return self.level == "W"
 
 
-@dataclass
+@dataclass(slots=True)
 class LogCollectionResult:
     """
     Result of log collection.
@@ -110,6 +201,10 @@ class LogCollector:
         entries: Collected log entries
     """
     
+    # Most recent entries kept in memory during a live collection so the
+    # accessors still work after stop; bounds RSS on long runs
+    MAX_LIVE_ENTRIES = 10000
+
     # Log level priorities (higher = more severe)
     LOG_LEVELS = {
         "V": 1,  # Verbose
@@ -137,6 +232,8 @@ class LogCollector:
         self.platform_utils = get_platform_utils()
         self.device_serial = device_serial
         self.log_filter = log_filter or ["E", "W", "F"]
+        # Frozenset mirror for O(1) per-line membership checks
+        self._log_filter_set = frozenset(self.log_filter)
         self.package_filter = package_filter
         
         self.log_file: Optional[Path] = None
@@ -145,7 +242,56 @@ class LogCollector:
         self.entries: List[LogEntry] = []
         self.start_time = 0.0
         self.log_thread: Optional[threading.Thread] = None
+        # Producer/consumer handoff: the reader thread only drains the
+        # logcat pipe; parsing happens on a separate thread so a parse
+        # stall can never back up the pipe and block adb
+        self._raw_queue: Optional[queue.SimpleQueue] = None
+        self._parse_thread: Optional[threading.Thread] = None
+        # Guards process handoff so stop_collection and the collector
+        # thread's cleanup never both terminate/wait the same process
+        self._proc_lock = threading.Lock()
+        # Backstop for duration-limited collections (see start_collection)
+        self._duration_timer: Optional[threading.Timer] = None
+        # Live collections stream formatted entries straight to disk and
+        # keep only these aggregates plus a bounded tail of recent
+        # entries; self.entries holds the full list for offline parsing
+        # and the tail after a live collection stops
+        self._log_fh = None
+        self._live_entries: deque = deque(maxlen=self.MAX_LIVE_ENTRIES)
+        self._total_count = 0
+        self._error_count = 0
+        self._warning_count = 0
     
+    def configure(
+        self,
+        package_filter: Optional[str] = None,
+        log_filter: Optional[List[str]] = None
+    ) -> None:
+        """
+        Re-point this collector at another app between collections.
+
+        Lets one instance be reused across apps instead of being rebuilt
+        per attempt; per-run state is reset by start_collection.
+
+        Args:
+            package_filter: New package name to filter logs
+            log_filter: Replacement log levels (default: keep current)
+
+        Raises:
+            LogCollectionError: If a collection is currently running
+        """
+        if self.collecting:
+            raise LogCollectionError(
+                "Cannot reconfigure while collection is in progress"
+            )
+
+        if log_filter is not None:
+            self.log_filter = log_filter
+            self._log_filter_set = frozenset(log_filter)
+        self.package_filter = package_filter
+        self.entries = []
+        self._live_entries.clear()
+
     def start_collection(self, duration: Optional[int] = None) -> None:
         """
         Start logcat collection in background thread.
@@ -168,6 +314,16 @@ class LogCollector:
         # Clear existing logcat buffer
         self._clear_logcat_buffer()
         
+        # Stream entries to the log file as they arrive instead of
+        # buffering them all for a single write at stop time
+        self._log_fh = open(self.log_file, 'w', encoding='utf-8',
+                            buffering=1 << 20)
+        self._write_header(self._log_fh)
+        self._live_entries.clear()
+        self._total_count = 0
+        self._error_count = 0
+        self._warning_count = 0
+
         # Start collection in background
         self.start_time = time.time()
         self.collecting = True
@@ -180,6 +336,17 @@ class LogCollector:
             daemon=True
         )
         self.log_thread.start()
+
+        # The reader only re-checks the deadline every 256 lines, so a
+        # trickling filtered stream could overrun the duration without
+        # bound; the timer terminates logcat at the deadline regardless,
+        # which unblocks readline with EOF
+        if duration:
+            self._duration_timer = threading.Timer(
+                duration, self._stop_process, args=(1.0,)
+            )
+            self._duration_timer.daemon = True
+            self._duration_timer.start()
     
     def stop_collection(self) -> LogCollectionResult:
         """
@@ -193,32 +360,47 @@ class LogCollector:
 
         logger.info("Stopping log collection")
         self.collecting = False
-        
+
+        if self._duration_timer is not None:
+            self._duration_timer.cancel()
+            self._duration_timer = None
+
         # Stop logcat process
-        if self.log_process:
-            self.log_process.terminate()
-            try:
-                self.log_process.wait(timeout=2.0)
-            except subprocess.TimeoutExpired:
-                self.log_process.kill()
-                self.log_process.wait()
-            self.log_process = None
+        self._stop_process(timeout=2.0)
         
         # Wait for thread to finish
         if self.log_thread:
             self.log_thread.join(timeout=5.0)
             self.log_thread = None
-        
-        # Save logs to file
-        if self.entries:
-            self._save_logs()
-        
+
+        # Entries were streamed to disk as they arrived; just close
+        if self._log_fh is not None:
+            try:
+                self._log_fh.close()
+            except OSError as e:
+                logger.error(f"Failed to close log file: {e}")
+            self._log_fh = None
+
+        # Keep the recent tail addressable through the normal accessors
+        # (get_entries/analyze_logs); the full stream lives in log_file
+        self.entries = list(self._live_entries)
+        self._live_entries.clear()
+
+        # Nothing was collected: drop the header-only file so callers
+        # see the same no-entries-no-file behavior as offline parsing
+        if self._total_count == 0 and self.log_file is not None:
+            try:
+                self.log_file.unlink()
+            except OSError as e:
+                logger.error(f"Failed to remove empty log file: {e}")
+            self.log_file = None
+
         # Calculate result
         duration_time = time.time() - self.start_time
         result = LogCollectionResult(
-            total_entries=len(self.entries),
-            error_count=sum(1 for e in self.entries if e.is_error()),
-            warning_count=sum(1 for e in self.entries if e.is_warning()),
+            total_entries=self._total_count,
+            error_count=self._error_count,
+            warning_count=self._warning_count,
             duration=duration_time,
             log_file=self.log_file
         )
@@ -269,34 +451,62 @@ class LogCollector:
         Returns:
             Dictionary with log statistics
         """
-        stats = {
-            "total": len(self.entries),
-            "by_level": {},
-            "by_tag": {},
-            "errors": [],
-            "warnings": []
+        entries = self.entries
+        # Counter does the tallying at C speed; level checks are inlined
+        # set lookups rather than per-entry method calls
+        return {
+            "total": len(entries),
+            "by_level": dict(Counter(e.level for e in entries)),
+            "by_tag": dict(Counter(e.tag for e in entries if e.tag)),
+            "errors": [e.to_dict() for e in entries if e.level in ('E', 'F')],
+            "warnings": [e.to_dict() for e in entries if e.level == 'W']
         }
-        
-        for entry in self.entries:
-            # Count by level
-            if entry.level not in stats["by_level"]:
-                stats["by_level"][entry.level] = 0
-            stats["by_level"][entry.level] += 1
-            
-            # Count by tag
-            if entry.tag:
-                if entry.tag not in stats["by_tag"]:
-                    stats["by_tag"][entry.tag] = 0
-                stats["by_tag"][entry.tag] += 1
-            
-            # Collect errors and warnings
-            if entry.is_error():
-                stats["errors"].append(entry.to_dict())
-            elif entry.is_warning():
-                stats["warnings"].append(entry.to_dict())
-        
-        return stats
     
+    def analyze_file(self, log_file) -> dict:
+        """
+        Analyze a saved log file, parallelized across CPU cores.
+
+        Large files are split into newline-aligned byte ranges parsed by
+        worker processes; partial counters are merged in the parent.
+
+        Args:
+            log_file: Path to a saved log file
+
+        Returns:
+            Dictionary with total, by_level, by_tag, error_count and
+            warning_count statistics
+        """
+        path = str(log_file)
+        size = os.path.getsize(path)
+        workers = min(multiprocessing.cpu_count(), 8)
+
+        # Process startup costs more than it saves on small files
+        if size < (1 << 20) or workers == 1:
+            partials = [_analyze_chunk((path, 0, size))]
+        else:
+            chunk = size // workers
+            ranges = [
+                (path, i * chunk,
+                 (i + 1) * chunk if i < workers - 1 else size)
+                for i in range(workers)
+            ]
+            with multiprocessing.Pool(workers) as pool:
+                partials = list(pool.imap_unordered(_analyze_chunk, ranges))
+
+        by_level = Counter()
+        by_tag = Counter()
+        for level_part, tag_part in partials:
+            by_level += level_part
+            by_tag += tag_part
+
+        return {
+            "total": sum(by_level.values()),
+            "by_level": dict(by_level),
+            "by_tag": dict(by_tag),
+            "error_count": sum(by_level[l] for l in _ERROR_LEVELS),
+            "warning_count": by_level.get("W", 0)
+        }
+
     def _prepare_log_file(self) -> Path:
         """
         Prepare log file path.
@@ -330,17 +540,16 @@ class LogCollector:
         """
         # Build logcat command
         adb_cmd = self.platform_utils.get_adb_command()
+        # threadtime has the fixed "date time pid tid level tag: msg"
+        # column layout the positional parser expects
         logcat_cmd = [
             adb_cmd, "-s", self.device_serial,
-            "logcat", "-v", "time"
+            "logcat", "-v", "threadtime"
         ]
-        
-        # Add package filter if specified
-        if self.package_filter:
-            logcat_cmd.append(f"*:{self.package_filter}")
-        else:
-            # Filter by log level
-            logcat_cmd.append("*:V")  # Capture all levels, filter later
+
+        # Filter by level on-device: lines below the least severe
+        # requested level never cross the adb socket
+        logcat_cmd.append(f"*:{self._min_filter_level()}")
         
         try:
             # Start logcat process
@@ -349,68 +558,204 @@ class LogCollector:
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True,
-                bufsize=1  # Line buffered
+                bufsize=65536  # Block buffered; readline still works per-line
             )
-            
+
+            # Parsing runs on its own thread fed through the raw queue
+            self._raw_queue = queue.SimpleQueue()
+            self._parse_thread = threading.Thread(
+                target=self._parse_loop,
+                daemon=True
+            )
+            self._parse_thread.start()
+
             # Set timeout for duration
             if duration:
                 timeout_time = self.start_time + duration
             else:
                 timeout_time = float('inf')
-            
-            # Read logs in real-time
-            while self.collecting and time.time() < timeout_time:
-                if self.log_process.poll() is not None:
+
+            # Read logs in real-time; this loop only drains the pipe.
+            # iter(readline, '') ends on EOF, so there is no per-line
+            # poll() syscall or exception-handler setup
+            put = self._raw_queue.put
+            count = 0
+            for line in iter(self.log_process.stdout.readline, ''):
+                put(line)
+                count += 1
+                # Stop/timeout check every 256 lines is plenty; a killed
+                # process unblocks readline with EOF regardless
+                if (count & 255) == 0 and (
+                        not self.collecting
+                        or time.time() >= timeout_time):
                     break
-                
-                try:
-                    line = self.log_process.stdout.readline()
-                    if not line:
-                        break
-                    
-                    # Parse and filter log
-                    self._parse_log_line(line)
-
-                except LogParseError as e:
-                    logger.warning(f"Error reading log line: {e}")
 
         except LogCollectionError as e:
             logger.error(f"Log collection failed: {e}", exc_info=True)
         finally:
             self.collecting = False
-            if self.log_process:
-                self.log_process.terminate()
-                try:
-                    self.log_process.wait(timeout=1.0)
-                except subprocess.TimeoutExpired:
-                    self.log_process.kill()
-                self.log_process = None
+            if self._raw_queue is not None:
+                # Sentinel lets the parser drain remaining lines and exit
+                self._raw_queue.put(None)
+            if self._parse_thread is not None:
+                self._parse_thread.join(timeout=5.0)
+                self._parse_thread = None
+            self._stop_process(timeout=1.0)
+
+    def _stop_process(self, timeout: float) -> None:
+        """
+        Terminate the logcat process exactly once.
+
+        Both stop_collection and the collector thread's cleanup funnel
+        through here; the lock ensures only the first caller pays the
+        terminate/wait sequence.
+
+        Args:
+            timeout: Seconds to wait before escalating to kill
+        """
+        with self._proc_lock:
+            process = self.log_process
+            self.log_process = None
+        if process is None:
+            return
+
+        process.terminate()
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+    def _min_filter_level(self) -> str:
+        """
+        Return the least severe level in the filter.
+
+        Used as the on-device logcat filterspec so filtered-out levels
+        are dropped before transmission.
+
+        Returns:
+            Single-character log level (falls back to "V")
+        """
+        levels = [l for l in self.log_filter if l in self.LOG_LEVELS]
+        if not levels:
+            return "V"
+        return min(levels, key=self.LOG_LEVELS.__getitem__)
+
+    def _parse_loop(self) -> None:
+        """Consume raw lines from the queue and parse them (parser thread).
+
+        Lines are drained in batches so _parse_lines amortizes its
+        per-batch setup across up to 256 lines.
+        """
+        get = self._raw_queue.get
+        get_nowait = self._raw_queue.get_nowait
+        parse_lines = self._parse_lines
+        while True:
+            line = get()
+            if line is None:
+                return
+            batch = [line]
+            try:
+                while len(batch) < 256:
+                    line = get_nowait()
+                    if line is None:
+                        parse_lines(batch)
+                        return
+                    batch.append(line)
+            except queue.Empty:
+                pass
+            parse_lines(batch)
     
+    def _parse_logs(self, raw_logs: str) -> None:
+        """
+        Parse a block of raw logcat output.
+
+        Args:
+            raw_logs: Multi-line logcat output
+        """
+        self._parse_lines(raw_logs.splitlines())
+
     def _parse_log_line(self, line: str) -> None:
         """
         Parse a single logcat line.
-        
+
         Args:
             line: Log line string
         """
-        # logcat time format: MM-DD HH:MM:SS.mmm PID  TID  LEVEL TAG: MESSAGE
-        pattern = re.compile(
-            r'(\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}\.\d{3})\s+(\d+)\s+(\d+)\s+([VDIWEF])\s+([^:]+):\s+(.*)'
-        )
-        
-        match = pattern.match(line)
+        self._parse_lines((line,))
+
+    def _parse_lines(self, lines) -> None:
+        """
+        Parse an iterable of logcat lines.
+
+        The threadtime format is strictly positional, so well-formed
+        lines are handled by a single split — several times cheaper than
+        the regex, which stays as a fallback for unusual spacing. All
+        per-line instance state is hoisted to locals once per batch.
+
+        Args:
+            lines: Iterable of log line strings
+        """
+        filter_set = self._log_filter_set
+        pkg_filter = self.package_filter
+        extract = self._extract_package
+        emit = self._emit
+        slow = self._parse_log_line_slow
+
+        for line in lines:
+            if not line:
+                continue
+            parts = line.split(None, 5)
+            if len(parts) == 6:
+                date, tod, pid, tid, level, rest = parts
+                if len(level) == 1 and level in "VDIWEF" \
+                        and pid.isdigit() and tid.isdigit():
+                    if level not in filter_set:
+                        continue
+                    sep = rest.find(': ')
+                    if sep != -1:
+                        message = rest[sep + 2:]
+                        emit(LogEntry(
+                            timestamp=date + ' ' + tod,
+                            pid=int(pid),
+                            tid=int(tid),
+                            level=level,
+                            tag=rest[:sep].strip(),
+                            message=message.strip(),
+                            package=extract(message) or pkg_filter
+                        ))
+                        continue
+
+            slow(line)
+
+    def _parse_log_line_slow(self, line: str) -> None:
+        """
+        Regex fallback for lines the positional parser rejects.
+
+        Args:
+            line: Log line string
+        """
+        # Most lines are Verbose/Debug noise that the filter discards;
+        # probe the level char cheaply before running the full regex
+        if len(line) < 20:
+            return
+        probe = _LEVEL_PROBE_RE.search(line, 18)
+        if probe is not None and probe.group(1) not in self._log_filter_set:
+            return
+
+        match = _LOGCAT_LINE_RE.match(line)
         if not match:
             return
-        
+
         timestamp, pid, tid, level, tag, message = match.groups()
-        
+
         # Filter by log level
-        if level not in self.log_filter:
+        if level not in self._log_filter_set:
             return
-        
+
         # Try to extract package from message if possible
         package = self._extract_package(message) or self.package_filter
-        
+
         entry = LogEntry(
             timestamp=timestamp,
             pid=int(pid),
@@ -420,8 +765,32 @@ class LogCollector:
             message=message.strip(),
             package=package
         )
-        
-        self.entries.append(entry)
+
+        self._emit(entry)
+
+    def _emit(self, entry: LogEntry) -> None:
+        """
+        Route a parsed entry to the stream file or the in-memory list.
+
+        During live collection the formatted entry goes straight to disk
+        and only counters plus a bounded tail of recent entries stay in
+        memory; offline parsing keeps every entry for
+        get_entries()/analyze_logs().
+
+        Args:
+            entry: Parsed log entry
+        """
+        fh = self._log_fh
+        if fh is not None:
+            fh.write(_format_entry(entry))
+            self._live_entries.append(entry)
+            self._total_count += 1
+            if entry.level in ('E', 'F'):
+                self._error_count += 1
+            elif entry.level == 'W':
+                self._warning_count += 1
+        else:
+            self.entries.append(entry)
     
     def _extract_package(self, message: str) -> Optional[str]:
         """
@@ -433,32 +802,48 @@ class LogCollector:
         Returns:
             Package name or None
         """
-        # Pattern for package names: com.example.app
-        package_pattern = re.compile(r'([a-z]+\.[a-z]+\.[a-z]+(?:\.[a-z]+)*)')
-        match = package_pattern.search(message)
+        # A package name needs at least two dots; most messages have
+        # none, so this pretest skips the regex entirely for them
+        if message.count('.') < 2:
+            return None
+        match = _PACKAGE_RE.search(message)
         return match.group(1) if match else None
     
+    def _write_header(self, f, total: Optional[int] = None) -> None:
+        """
+        Write the log file header.
+
+        Args:
+            f: Open text file handle
+            total: Entry count, when known up front (omitted while
+                streaming because entries are still arriving)
+        """
+        header = (
+            f"# Log Collection Report\n"
+            f"# Device: {self.device_serial}\n"
+            f"# Start Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+        )
+        if total is not None:
+            header += f"# Total Entries: {total}\n"
+        header += f"# Filter: {self.log_filter}\n"
+        if self.package_filter:
+            header += f"# Package: {self.package_filter}\n"
+        header += "# " + "=" * 80 + "\n\n"
+        f.write(header)
+
     def _save_logs(self) -> None:
         """Save collected logs to file."""
         if not self.log_file or not self.entries:
             return
         
         try:
-            with open(self.log_file, 'w', encoding='utf-8') as f:
-                f.write(f"# Log Collection Report\n")
-                f.write(f"# Device: {self.device_serial}\n")
-                f.write(f"# Start Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"# Total Entries: {len(self.entries)}\n")
-                f.write(f"# Filter: {self.log_filter}\n")
-                if self.package_filter:
-                    f.write(f"# Package: {self.package_filter}\n")
-                f.write(f"# " + "="*80 + "\n\n")
-                
-                for entry in self.entries:
-                    f.write(
-                        f"{entry.timestamp} {entry.pid:5d} {entry.tid:5d} "
-                        f"{entry.level} {entry.tag:30s}: {entry.message}\n"
-                    )
+            # Large buffer plus writelines: one formatted pass and a
+            # handful of write syscalls instead of one per entry
+            with open(self.log_file, 'w', encoding='utf-8',
+                      buffering=1 << 20) as f:
+                self._write_header(f, total=len(self.entries))
+
+                f.writelines(map(_format_entry, self.entries))
 
             logger.info(f"Logs saved to: {self.log_file}")
 
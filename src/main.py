@@ -6,6 +6,7 @@ CLI interface for running automated tests with optional GUI.
 
 import argparse
 import sys
+from dataclasses import replace
 from pathlib import Path
 from typing import List, Optional
 
@@ -140,6 +141,11 @@ Examples:
             type=str,
             help="Output directory for reports"
         )
+        run_parser.add_argument(
+            "--all-devices",
+            action="store_true",
+            help="Distribute tests across all connected devices"
+        )
         
         # Config command
         config_parser = subparsers.add_parser(
@@ -222,15 +228,17 @@ Examples:
         # Load settings
         self.settings = get_global_settings()
         
-        # Override settings from command line
-        if self.args.duration:
-            self.settings.test_duration = self.args.duration
-        
+        # Override settings from command line (GlobalSettings is frozen,
+        # so derive a modified copy; --duration is applied per-app below)
+        overrides = {}
         if self.args.no_logcat:
-            self.settings.collect_logcat = False
-        
+            overrides['collect_logcat'] = False
+
         if self.args.no_screenshot:
-            self.settings.screenshot_on_error = False
+            overrides['screenshot_on_error'] = False
+
+        if overrides:
+            self.settings = replace(self.settings, **overrides)
         
         # Initialize device manager
         print("[INFO] Initializing device manager...")
@@ -243,7 +251,10 @@ Examples:
             sys.exit(1)
         
         if len(devices) > 1:
-            print(f"[WARNING] Multiple devices found, using: {devices[0].serial}")
+            if self.args.all_devices:
+                print(f"[INFO] Distributing tests across {len(devices)} devices")
+            else:
+                print(f"[WARNING] Multiple devices found, using: {devices[0].serial}")
         
         # Connect to device
         print(f"[INFO] Connecting to device: {devices[0].serial}")
@@ -287,7 +298,9 @@ Examples:
         
         # Run tests
         print("\n[INFO] Starting test run...")
-        results = test_engine.run_all_tests(apps)
+        results = test_engine.run_all_tests(
+            apps, parallel_devices=self.args.all_devices
+        )
         
         # Generate reports
         if results:
@@ -5,11 +5,26 @@ Provides OS-specific utilities for Windows and Linux platforms.
 Handles path management, ADB command execution, and system command execution.
 """
 
+import asyncio
+import functools
+import os
+import re
 import subprocess
 import sys
+import time
 from pathlib import Path
 from typing import Tuple, Optional
 
+# The platform cannot change at runtime, so detect it once at import;
+# hot call sites (ADB command lookup) then read plain module globals
+IS_WINDOWS = sys.platform.startswith('win')
+IS_LINUX = sys.platform.startswith('linux')
+ADB_CMD = "adb.exe" if IS_WINDOWS else "adb"
+
+# Matches one serial per "adb devices" output line in the "device" state;
+# offline/unauthorized entries and the header line do not match
+_DEVICE_RE = re.compile(r'^(\S+)\tdevice\b', re.MULTILINE)
+
 
 class PlatformUtils:
     """
@@ -24,24 +39,37 @@ class PlatformUtils:
         is_linux (bool): True if running on Linux
         project_root (Path): Project root directory path
     """
-    
+
+    # How long ADB query results stay fresh; polling callers (the GUI
+    # refreshes, the CLI status checks) collapse onto one adb invocation
+    _ADB_CACHE_TTL = 2.0
+
+
     def __init__(self):
         """Initialize PlatformUtils and detect the operating system."""
         self.system = self._detect_system()
-        self.is_windows = self.system == "Windows"
-        self.is_linux = self.system == "Linux"
+        self.is_windows = IS_WINDOWS
+        self.is_linux = IS_LINUX
         self.project_root = self._get_project_root()
-    
+        # Resolved once; get_path is then a dict lookup
+        self._paths = {
+            name: self.project_root / name
+            for name in ("config", "screenshots", "reports", "logs", "templates")
+        }
+        # (monotonic timestamp, result) pairs; see _ADB_CACHE_TTL
+        self._adb_available_cache: Optional[Tuple[float, bool]] = None
+        self._devices_cache: Optional[Tuple[float, list]] = None
+
     def _detect_system(self) -> str:
         """
         Detect the current operating system.
-        
+
         Returns:
             str: "Windows" or "Linux"
         """
-        if sys.platform.startswith('win'):
+        if IS_WINDOWS:
             return "Windows"
-        elif sys.platform.startswith('linux'):
+        elif IS_LINUX:
             return "Linux"
         else:
             raise RuntimeError(f"Unsupported platform: {sys.platform}")
@@ -68,10 +96,7 @@ class PlatformUtils:
         Returns:
             str: ADB command ("adb.exe" on Windows, "adb" on Linux)
         """
-        if self.is_windows:
-            return "adb.exe"
-        else:
-            return "adb"
+        return ADB_CMD
     
     def get_path(self, name: str) -> Path:
         """
@@ -87,21 +112,13 @@ class PlatformUtils:
         Raises:
             ValueError: If the path name is not recognized
         """
-        valid_paths = {
-            "config": "config",
-            "screenshots": "screenshots",
-            "reports": "reports",
-            "logs": "logs",
-            "templates": "templates",
-        }
-        
-        if name not in valid_paths:
+        try:
+            return self._paths[name]
+        except KeyError:
             raise ValueError(
                 f"Unknown path name: {name}. "
-                f"Valid names are: {list(valid_paths.keys())}"
-            )
-        
-        return self.project_root / valid_paths[name]
+                f"Valid names are: {list(self._paths.keys())}"
+            ) from None
     
     def ensure_directories(self) -> None:
         """
@@ -115,10 +132,13 @@ class PlatformUtils:
         - templates
         """
         directories = ["config", "screenshots", "reports", "logs", "templates"]
-        
+
+        # One scandir of the project root replaces a stat per directory;
+        # mkdir is only issued for entries that are actually missing
+        existing = {entry.name for entry in os.scandir(self.project_root)}
         for dir_name in directories:
-            path = self.get_path(dir_name)
-            path.mkdir(parents=True, exist_ok=True)
+            if dir_name not in existing:
+                os.mkdir(self.project_root / dir_name)
     
     def run_command(
         self,
@@ -141,14 +161,25 @@ class PlatformUtils:
             >>> utils = PlatformUtils()
             >>> code, out, err = utils.run_command(["ls", "-l"])
         """
+        # Bytes mode rather than text=True: decoding by hand keeps the
+        # child on subprocess's posix_spawn fast path and lets malformed
+        # device output degrade to replacement characters instead of raising
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=capture_output,
-                text=True,
-                timeout=timeout
-            )
-            return result.returncode, result.stdout, result.stderr
+            if capture_output:
+                result = subprocess.run(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    timeout=timeout
+                )
+                return (
+                    result.returncode,
+                    result.stdout.decode('utf-8', errors='replace'),
+                    result.stderr.decode('utf-8', errors='replace')
+                )
+
+            result = subprocess.run(cmd, timeout=timeout)
+            return result.returncode, "", ""
         except subprocess.TimeoutExpired:
             return -1, "", f"Command timed out after {timeout} seconds"
         except Exception as e:
@@ -158,49 +189,122 @@ class PlatformUtils:
         """
         Check if ADB (Android Debug Bridge) is available.
         
+        Results are cached for _ADB_CACHE_TTL seconds.
+
         Returns:
             bool: True if ADB is available, False otherwise
         """
-        adb_cmd = self.get_adb_command()
-        code, _, _ = self.run_command([adb_cmd, "version"])
-        return code == 0
+        now = time.monotonic()
+        cached = self._adb_available_cache
+        if cached is not None and now - cached[0] < self._ADB_CACHE_TTL:
+            return cached[1]
+
+        code, _, _ = self.run_command([ADB_CMD, "version"])
+        available = code == 0
+        self._adb_available_cache = (now, available)
+        return available
     
     def get_connected_devices(self) -> list[str]:
         """
         Get a list of connected Android device serial numbers.
         
+        Results are cached for _ADB_CACHE_TTL seconds.
+
         Returns:
             List of device serial numbers (empty list if no devices connected)
         """
-        adb_cmd = self.get_adb_command()
-        code, output, _ = self.run_command([adb_cmd, "devices"])
-        
+        now = time.monotonic()
+        cached = self._devices_cache
+        if cached is not None and now - cached[0] < self._ADB_CACHE_TTL:
+            return cached[1]
+
+        code, output, _ = self.run_command([ADB_CMD, "devices"])
+
         if code != 0:
             return []
-        
-        devices = []
-        lines = output.strip().split('\n')[1:]  # Skip header line
-        
-        for line in lines:
-            if line.strip() and '\tdevice' in line:
-                serial = line.split('\t')[0].strip()
-                devices.append(serial)
-        
+
+        devices = _DEVICE_RE.findall(output)
+        self._devices_cache = (now, devices)
         return devices
 
+    async def run_command_async(
+        self,
+        cmd: list,
+        timeout: Optional[int] = None
+    ) -> Tuple[int, str, str]:
+        """
+        Execute a system command without blocking the event loop.
 
-# Global instance for convenience
-_platform_utils: Optional[PlatformUtils] = None
+        Async counterpart of run_command with the same return contract,
+        so several ADB invocations can run concurrently via asyncio.gather.
 
+        Args:
+            cmd: Command to execute as a list of strings
+            timeout: Optional timeout in seconds (None for no timeout)
+
+        Returns:
+            Tuple[int, str, str]: (return_code, stdout, stderr)
+        """
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            stdout, stderr = await asyncio.wait_for(
+                process.communicate(), timeout=timeout
+            )
+            return (
+                process.returncode,
+                stdout.decode('utf-8', errors='replace'),
+                stderr.decode('utf-8', errors='replace')
+            )
+        except asyncio.TimeoutError:
+            process.kill()
+            return -1, "", f"Command timed out after {timeout} seconds"
+        except Exception as e:
+            return -1, "", f"Command execution failed: {str(e)}"
 
+    async def check_adb_available_async(self) -> bool:
+        """
+        Async variant of check_adb_available.
+
+        Returns:
+            bool: True if ADB is available, False otherwise
+        """
+        code, _, _ = await self.run_command_async([ADB_CMD, "version"])
+        return code == 0
+
+    async def get_connected_devices_async(self) -> list[str]:
+        """
+        Async variant of get_connected_devices.
+
+        Returns:
+            List of device serial numbers (empty list if no devices connected)
+        """
+        code, output, _ = await self.run_command_async([ADB_CMD, "devices"])
+
+        return _DEVICE_RE.findall(output) if code == 0 else []
+
+    async def probe(self) -> Tuple[bool, list[str]]:
+        """
+        Check ADB availability and enumerate devices concurrently.
+
+        Returns:
+            Tuple[bool, list[str]]: (adb_available, device_serials)
+        """
+        return tuple(await asyncio.gather(
+            self.check_adb_available_async(),
+            self.get_connected_devices_async()
+        ))
+
+
+@functools.cache
 def get_platform_utils() -> PlatformUtils:
     """
     Get the global PlatformUtils instance.
-    
+
     Returns:
         PlatformUtils: The global instance
     """
-    global _platform_utils
-    if _platform_utils is None:
-        _platform_utils = PlatformUtils()
-    return _platform_utils
\ No newline at end of file
+    return PlatformUtils()
\ No newline at end of file
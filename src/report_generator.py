@@ -5,9 +5,14 @@ Generates test reports in various formats.
 Supports text, HTML, and JSON reports.
 """
 
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from datetime import datetime
+from html import escape as _esc
+from itertools import islice
 from pathlib import Path
+from string import Template
 from typing import List, Optional
 
 from .platform_utils import get_platform_utils
@@ -17,8 +22,271 @@ from .exceptions import ReportError, ReportGenerationError
 
 logger = get_logger(__name__)
 
+# orjson serializes several times faster than the stdlib; fall back to
+# json when it is not installed.  Both paths produce indented bytes so
+# the report file can be written in binary mode either way.
+try:
+    import orjson
 
-@dataclass
+    def _dump_json(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+
+    def _dump_json(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+
+# HTML templates are parsed once at import time; per-report work is then a
+# single substitute() per block instead of re-assembling the markup from
+# f-string fragments on every call.  Status colors are fixed, so they are
+# written into the stylesheet as literals.
+_HTML_RESULT_TEMPLATE = Template("""
+            <div class="test-result">
+                <div class="result-header">
+                    <h3>${app_name}</h3>
+                    <span class="status ${status_class}">${status_icon}</span>
+                </div>
+                <div class="result-details">
+                    <div class="detail-row">
+                        <span class="label">Package:</span>
+                        <span class="value">${package}</span>
+                    </div>
+                    <div class="detail-row">
+                        <span class="label">Status:</span>
+                        <span class="value ${status_class}">
+                            ${status_text}
+                        </span>
+                    </div>
+                    <div class="detail-row">
+                        <span class="label">Duration:</span>
+                        <span class="value">${duration}s</span>
+                    </div>
+                    <div class="detail-row">
+                        <span class="label">Screens:</span>
+                        <span class="value">${screens_visited}</span>
+                    </div>
+                    <div class="detail-row">
+                        <span class="label">Elements:</span>
+                        <span class="value">${elements_interacted}</span>
+                    </div>
+                    <div class="detail-row">
+                        <span class="label">Actions:</span>
+                        <span class="value">${actions_count}</span>
+                    </div>
+            ${extras}</div></div>""")
+
+# The stylesheet is static; keeping it as its own constant makes the
+# shell below easier to read and the concatenation happens once at
+# import, not per report
+_HTML_CSS = """
+        * {
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }
+        body {
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            background: #f5f5f5;
+            color: #333;
+            line-height: 1.6;
+        }
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+            padding: 20px;
+        }
+        header {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 30px;
+            border-radius: 10px;
+            margin-bottom: 30px;
+            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+        }
+        header h1 {
+            font-size: 2em;
+            margin-bottom: 10px;
+        }
+        .summary {
+            background: white;
+            padding: 30px;
+            border-radius: 10px;
+            margin-bottom: 30px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        .summary h2 {
+            color: #667eea;
+            margin-bottom: 20px;
+            border-bottom: 2px solid #667eea;
+            padding-bottom: 10px;
+        }
+        .summary-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 20px;
+            margin-top: 20px;
+        }
+        .summary-card {
+            background: #f8f9fa;
+            padding: 20px;
+            border-radius: 8px;
+            text-align: center;
+        }
+        .summary-card .value {
+            font-size: 2.5em;
+            font-weight: bold;
+            color: #667eea;
+            margin-bottom: 5px;
+        }
+        .summary-card .label {
+            color: #666;
+            font-size: 0.9em;
+        }
+        .test-result {
+            background: white;
+            padding: 25px;
+            border-radius: 10px;
+            margin-bottom: 20px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+            border-left: 4px solid #4CAF50;
+        }
+        .test-result.fail {
+            border-left-color: #F44336;
+        }
+        .result-header {
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+            margin-bottom: 20px;
+        }
+        .result-header h3 {
+            color: #333;
+        }
+        .status {
+            font-size: 1.5em;
+        }
+        .result-details {
+            margin-top: 15px;
+        }
+        .detail-row {
+            display: flex;
+            justify-content: space-between;
+            padding: 8px 0;
+            border-bottom: 1px solid #eee;
+        }
+        .detail-row:last-child {
+            border-bottom: none;
+        }
+        .label {
+            font-weight: 600;
+            color: #666;
+        }
+        .value {
+            color: #333;
+        }
+        .value.pass {
+            color: #4CAF50;
+            font-weight: bold;
+        }
+        .value.fail {
+            color: #F44336;
+            font-weight: bold;
+        }
+        .errors-list {
+            background: #fff3cd;
+            padding: 15px;
+            border-radius: 5px;
+            margin-top: 10px;
+        }
+        .error-item {
+            color: #856404;
+            padding: 5px 0;
+            padding-left: 20px;
+            position: relative;
+        }
+        .error-item:before {
+            content: "•";
+            position: absolute;
+            left: 5px;
+        }
+        .error-message {
+            color: #F44336;
+            font-weight: 600;
+        }
+        footer {
+            text-align: center;
+            padding: 20px;
+            color: #666;
+            margin-top: 30px;
+        }
+"""
+
+# The page shell, split around the results marker so the report can be
+# streamed: a head template (summary placeholders), then one chunk per
+# result, then the static tail
+_HTML_SHELL_TEMPLATE = Template("""
+<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Test Report - ${test_date}</title>
+    <style>""" + _HTML_CSS + """</style>
+</head>
+<body>
+    <div class="container">
+        <header>
+            <h1>📱 Android App Automatic Test Report</h1>
+            <p>Generated on ${test_date}</p>
+        </header>
+
+        <div class="summary">
+            <h2>📊 Summary</h2>
+            ${device_block}
+            <div class="summary-grid">
+                <div class="summary-card">
+                    <div class="value">${total_tests}</div>
+                    <div class="label">Total Tests</div>
+                </div>
+                <div class="summary-card">
+                    <div class="value" style="color: #4CAF50">${successful_tests}</div>
+                    <div class="label">Successful ✅</div>
+                </div>
+                <div class="summary-card">
+                    <div class="value" style="color: #F44336">${failed_tests}</div>
+                    <div class="label">Failed ❌</div>
+                </div>
+                <div class="summary-card">
+                    <div class="value">${success_rate}%</div>
+                    <div class="label">Success Rate</div>
+                </div>
+                <div class="summary-card">
+                    <div class="value">${total_duration}s</div>
+                    <div class="label">Duration</div>
+                </div>
+            </div>
+        </div>
+
+        <div class="test-results">
+            <h2 style="color: #667eea; margin-bottom: 20px;">📋 Test Results</h2>
+            ${results}
+        </div>
+
+        <footer>
+            <p>Generated by Android App Auto Tester</p>
+        </footer>
+    </div>
+</body>
+</html>
+""")
+
+_head, _tail = _HTML_SHELL_TEMPLATE.template.split("${results}")
+_HTML_HEAD_TEMPLATE = Template(_head)
+_HTML_TAIL = _tail
+del _head, _tail
+
+@dataclass(slots=True)
 class ReportData:
     """
     Data container for report generation.
@@ -44,6 +312,10 @@ class ReportData:
     
     def to_dict(self) -> dict:
         """Convert ReportData to dictionary."""
+        # Deliberately not dataclasses.asdict: that would recurse into
+        # test_results and deep-copy them with log_file/screenshot_files
+        # still as Path objects, which the JSON serializers reject.
+        # TestResult.to_dict does the Path-to-str conversion.
         return {
             "test_date": self.test_date,
             "device_info": self.device_info,
@@ -76,7 +348,10 @@ class ReportGenerator:
         """
         self.platform_utils = get_platform_utils()
         self.output_dir = output_dir or self.platform_utils.get_path("reports")
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        # A generator is built per report run and the directory exists
+        # after the first; probe before paying for makedirs
+        if not os.path.isdir(self.output_dir):
+            os.makedirs(self.output_dir, exist_ok=True)
     
     def generate_report(
         self,
@@ -100,147 +375,217 @@ class ReportGenerator:
         
         # Prepare report data
         report_data = self._prepare_report_data(test_results, device_info)
-        
-        generated_files = []
-        
-        # Generate reports in specified formats
+
+        # One timestamp for the whole batch: saves repeated strftime calls
+        # and keeps sibling reports from straddling a second boundary
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+
+        # Dispatch table with pre-uppercased labels for the log line
+        generators = {
+            "text": (self.generate_text_report, "TEXT"),
+            "html": (self.generate_html_report, "HTML"),
+            "json": (self.generate_json_report, "JSON"),
+        }
+
+        tasks = []
         for format_type in formats:
             try:
-                if format_type == "text":
-                    file_path = self.generate_text_report(report_data)
-                elif format_type == "html":
-                    file_path = self.generate_html_report(report_data)
-                elif format_type == "json":
-                    file_path = self.generate_json_report(report_data)
-                else:
-                    logger.warning(f"Unknown format: {format_type}")
-                    continue
-                
-                if file_path:
-                    generated_files.append(file_path)
-                    logger.info(f"Generated {format_type.upper()} report: {file_path}")
-
-            except ReportGenerationError as e:
-                logger.error(f"Failed to generate {format_type} report: {e}")
+                generator, label = generators[format_type]
+            except KeyError:
+                logger.warning(f"Unknown format: {format_type}")
+                continue
+            tasks.append((format_type, generator, label))
+
+        generated_files = []
+        if not tasks:
+            return generated_files
+
+        # The generators touch disjoint files and spend their time in
+        # formatting and file I/O, so a small thread pool overlaps them;
+        # a single format runs inline without pool overhead
+        if len(tasks) == 1:
+            format_type, generator, label = tasks[0]
+            self._collect_report(
+                generated_files, format_type, label,
+                lambda: generator(report_data, timestamp)
+            )
+        else:
+            with ThreadPoolExecutor(max_workers=len(tasks)) as pool:
+                futures = {
+                    pool.submit(generator, report_data, timestamp):
+                        (format_type, label)
+                    for format_type, generator, label in tasks
+                }
+                for future in as_completed(futures):
+                    format_type, label = futures[future]
+                    self._collect_report(
+                        generated_files, format_type, label, future.result
+                    )
         
         return generated_files
-    
-    def generate_text_report(self, report_data: ReportData) -> Optional[Path]:
+
+    def _collect_report(
+        self,
+        generated_files: List[Path],
+        format_type: str,
+        label: str,
+        get_result
+    ) -> None:
+        """
+        Collect one generator's result, logging the outcome.
+
+        Args:
+            generated_files: List to append the generated path to
+            format_type: Format name for error logging
+            label: Uppercased format label for the success log line
+            get_result: Zero-argument callable yielding the report path
+        """
+        try:
+            file_path = get_result()
+
+            if file_path:
+                generated_files.append(file_path)
+                logger.info(f"Generated {label} report: {file_path}")
+
+        except ReportGenerationError as e:
+            logger.error(f"Failed to generate {format_type} report: {e}")
+
+    def generate_text_report(
+        self,
+        report_data: ReportData,
+        timestamp: Optional[str] = None
+    ) -> Optional[Path]:
         """
         Generate text format report.
-        
+
         Args:
             report_data: Report data
-        
+            timestamp: Filename timestamp (default: current time)
+
         Returns:
             Path to generated report or None if failed
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if timestamp is None:
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
         filename = f"report_{timestamp}.txt"
         file_path = self.output_dir / filename
         
         try:
+            # Assemble the report in memory and write it in one call; the
+            # bound append avoids an attribute lookup per line
+            parts = []
+            append = parts.append
+
+            # Header
+            append("="*80 + "\n")
+            append("                    ANDROID APP AUTOMATIC TEST REPORT\n")
+            append("="*80 + "\n\n")
+
+            # Summary
+            append("SUMMARY\n")
+            append("-"*80 + "\n")
+            append(f"Test Date:     {report_data.test_date}\n")
+            if report_data.device_info:
+                append(f"Device:        {report_data.device_info}\n")
+            append(f"Total Tests:   {report_data.total_tests}\n")
+            append(f"Successful:    {report_data.successful_tests} ✅\n")
+            append(f"Failed:        {report_data.failed_tests} ❌\n")
+            append(f"Success Rate:  {report_data.success_rate:.1f}%\n")
+            append(f"Duration:      {report_data.total_duration:.2f}s\n")
+            append("\n")
+
+            # Test Results
+            append("TEST RESULTS\n")
+            append("-"*80 + "\n")
+
+            for i, result in enumerate(report_data.test_results, 1):
+                append(f"\n{i}. {result.app_name}\n")
+                append(f"   Package:    {result.package}\n")
+                append(f"   Status:     {'✅ PASS' if result.success else '❌ FAIL'}\n")
+                append(f"   Duration:   {result.duration:.2f}s\n")
+                append(f"   Screens:    {result.screens_visited}\n")
+                append(f"   Elements:   {result.elements_interacted}\n")
+                append(f"   Actions:    {len(result.actions_performed)}\n")
+
+                if result.errors_found:
+                    append(f"   Errors:     {len(result.errors_found)}\n")
+                    for error in islice(result.errors_found, 3):
+                        append(f"              - {error}\n")
+
+                if result.error_message:
+                    append(f"   Message:    {result.error_message}\n")
+
+            # Footer
+            append("\n" + "="*80 + "\n")
+            append("                          END OF REPORT\n")
+            append("="*80 + "\n")
+
             with open(file_path, 'w', encoding='utf-8') as f:
-                # Header
-                f.write("="*80 + "\n")
-                f.write("                    ANDROID APP AUTOMATIC TEST REPORT\n")
-                f.write("="*80 + "\n\n")
-                
-                # Summary
-                f.write("SUMMARY\n")
-                f.write("-"*80 + "\n")
-                f.write(f"Test Date:     {report_data.test_date}\n")
-                if report_data.device_info:
-                    f.write(f"Device:        {report_data.device_info}\n")
-                f.write(f"Total Tests:   {report_data.total_tests}\n")
-                f.write(f"Successful:    {report_data.successful_tests} ✅\n")
-                f.write(f"Failed:        {report_data.failed_tests} ❌\n")
-                f.write(f"Success Rate:  {report_data.success_rate:.1f}%\n")
-                f.write(f"Duration:      {report_data.total_duration:.2f}s\n")
-                f.write("\n")
-                
-                # Test Results
-                f.write("TEST RESULTS\n")
-                f.write("-"*80 + "\n")
-                
-                for i, result in enumerate(report_data.test_results, 1):
-                    f.write(f"\n{i}. {result.app_name}\n")
-                    f.write(f"   Package:    {result.package}\n")
-                    f.write(f"   Status:     {'✅ PASS' if result.success else '❌ FAIL'}\n")
-                    f.write(f"   Duration:   {result.duration:.2f}s\n")
-                    f.write(f"   Screens:    {result.screens_visited}\n")
-                    f.write(f"   Elements:   {result.elements_interacted}\n")
-                    f.write(f"   Actions:    {len(result.actions_performed)}\n")
-                    
-                    if result.errors_found:
-                        f.write(f"   Errors:     {len(result.errors_found)}\n")
-                        for error in result.errors_found[:3]:
-                            f.write(f"              - {error}\n")
-                    
-                    if result.error_message:
-                        f.write(f"   Message:    {result.error_message}\n")
-                
-                # Footer
-                f.write("\n" + "="*80 + "\n")
-                f.write("                          END OF REPORT\n")
-                f.write("="*80 + "\n")
-            
+                f.write("".join(parts))
+
             return file_path
 
         except ReportGenerationError as e:
             logger.error(f"Failed to generate text report: {e}")
             return None
     
-    def generate_html_report(self, report_data: ReportData) -> Optional[Path]:
+    def generate_html_report(
+        self,
+        report_data: ReportData,
+        timestamp: Optional[str] = None
+    ) -> Optional[Path]:
         """
         Generate HTML format report.
-        
+
         Args:
             report_data: Report data
-        
+            timestamp: Filename timestamp (default: current time)
+
         Returns:
             Path to generated report or None if failed
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if timestamp is None:
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
         filename = f"report_{timestamp}.html"
         file_path = self.output_dir / filename
         
-        html_content = self._generate_html_content(report_data)
-        
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-            
+            # Stream the chunks straight to disk instead of concatenating
+            # the whole page in memory first
+            with open(file_path, 'w', encoding='utf-8',
+                      buffering=64 * 1024) as f:
+                f.writelines(self._iter_html_content(report_data))
+
             return file_path
 
         except ReportGenerationError as e:
             logger.error(f"Failed to generate HTML report: {e}")
             return None
     
-    def generate_json_report(self, report_data: ReportData) -> Optional[Path]:
+    def generate_json_report(
+        self,
+        report_data: ReportData,
+        timestamp: Optional[str] = None
+    ) -> Optional[Path]:
         """
         Generate JSON format report.
-        
+
         Args:
             report_data: Report data
-        
+            timestamp: Filename timestamp (default: current time)
+
         Returns:
             Path to generated report or None if failed
         """
-        try:
-            import json
-        except ImportError:
-            logger.error("json module not available")
-            return None
-        
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if timestamp is None:
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
         filename = f"report_{timestamp}.json"
         file_path = self.output_dir / filename
-        
+
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(report_data.to_dict(), f, indent=2)
-            
+            with open(file_path, 'wb') as f:
+                f.write(_dump_json(report_data.to_dict()))
+
             return file_path
 
         except ReportGenerationError as e:
@@ -270,7 +615,7 @@ class ReportGenerator:
         total_duration = sum(r.duration for r in test_results)
         
         return ReportData(
-            test_date=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            test_date=time.strftime("%Y-%m-%d %H:%M:%S"),
             device_info=device_info,
             total_tests=total_tests,
             successful_tests=successful_tests,
@@ -283,279 +628,84 @@ class ReportGenerator:
     def _generate_html_content(self, report_data: ReportData) -> str:
         """
         Generate HTML content for report.
-        
+
         Args:
             report_data: Report data
-        
+
         Returns:
             HTML string
         """
-        success_color = "#4CAF50"  # Green
-        fail_color = "#F44336"    # Red
-        warning_color = "#FF9800"  # Orange
-        
-        # Build test results HTML
-        results_html = ""
+        return "".join(self._iter_html_content(report_data))
+
+    def _iter_html_content(self, report_data: ReportData):
+        """
+        Yield the HTML report as chunks: head, one per result, tail.
+
+        Args:
+            report_data: Report data
+
+        Yields:
+            str: HTML chunks in document order
+        """
+        yield _HTML_HEAD_TEMPLATE.substitute(
+            test_date=report_data.test_date,
+            device_block=(
+                f'<p><strong>Device:</strong> {report_data.device_info}</p>'
+                if report_data.device_info else ''
+            ),
+            total_tests=report_data.total_tests,
+            successful_tests=report_data.successful_tests,
+            failed_tests=report_data.failed_tests,
+            success_rate=f"{report_data.success_rate:.1f}",
+            total_duration=f"{report_data.total_duration:.0f}",
+        )
+
         for result in report_data.test_results:
-            status_color = success_color if result.success else fail_color
-            status_icon = "✅" if result.success else "❌"
-            
-            results_html += f"""
-            <div class="test-result">
-                <div class="result-header">
-                    <h3>{result.app_name}</h3>
-                    <span class="status {'pass' if result.success else 'fail'}">{status_icon}</span>
-                </div>
-                <div class="result-details">
-                    <div class="detail-row">
-                        <span class="label">Package:</span>
-                        <span class="value">{result.package}</span>
-                    </div>
-                    <div class="detail-row">
-                        <span class="label">Status:</span>
-                        <span class="value {'pass' if result.success else 'fail'}">
-                            {'PASS' if result.success else 'FAIL'}
-                        </span>
-                    </div>
-                    <div class="detail-row">
-                        <span class="label">Duration:</span>
-                        <span class="value">{result.duration:.2f}s</span>
-                    </div>
-                    <div class="detail-row">
-                        <span class="label">Screens:</span>
-                        <span class="value">{result.screens_visited}</span>
-                    </div>
-                    <div class="detail-row">
-                        <span class="label">Elements:</span>
-                        <span class="value">{result.elements_interacted}</span>
-                    </div>
-                    <div class="detail-row">
-                        <span class="label">Actions:</span>
-                        <span class="value">{len(result.actions_performed)}</span>
-                    </div>
-            """
-            
+            status_class = 'pass' if result.success else 'fail'
+
+            # App names and packages come from user-edited config and the
+            # error message from the device; escape each exactly once here
+            app_name = _esc(result.app_name)
+            package = _esc(result.package)
+
+            extras = []
             if result.errors_found:
-                results_html += f"""
+                extras.append(f"""
                     <div class="detail-row">
                         <span class="label">Errors ({len(result.errors_found)}):</span>
                     </div>
                     <div class="errors-list">
-                """
-                for error in result.errors_found[:5]:
-                    results_html += f"<div class='error-item'>{error}</div>"
+                """)
+                # islice avoids copying the head of the list; logcat error
+                # lines can contain <, > and & so escape them for the markup
+                for error in islice(result.errors_found, 5):
+                    extras.append(f"<div class='error-item'>{_esc(error)}</div>")
                 if len(result.errors_found) > 5:
-                    results_html += f"<div class='error-item'>... and {len(result.errors_found) - 5} more</div>"
-                results_html += "</div>"
-            
+                    extras.append(f"<div class='error-item'>... and {len(result.errors_found) - 5} more</div>")
+                extras.append("</div>")
+
             if result.error_message:
-                results_html += f"""
+                extras.append(f"""
                     <div class="detail-row">
                         <span class="label">Message:</span>
-                        <span class="value error-message">{result.error_message}</span>
+                        <span class="value error-message">{_esc(result.error_message)}</span>
                     </div>
-            """
-            
-            results_html += "</div></div>"
-        
-        # Build complete HTML
-        html = f"""
-<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Test Report - {report_data.test_date}</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: #f5f5f5;
-            color: #333;
-            line-height: 1.6;
-        }}
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 20px;
-        }}
-        header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 30px;
-            border-radius: 10px;
-            margin-bottom: 30px;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        }}
-        header h1 {{
-            font-size: 2em;
-            margin-bottom: 10px;
-        }}
-        .summary {{
-            background: white;
-            padding: 30px;
-            border-radius: 10px;
-            margin-bottom: 30px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        .summary h2 {{
-            color: #667eea;
-            margin-bottom: 20px;
-            border-bottom: 2px solid #667eea;
-            padding-bottom: 10px;
-        }}
-        .summary-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-            margin-top: 20px;
-        }}
-        .summary-card {{
-            background: #f8f9fa;
-            padding: 20px;
-            border-radius: 8px;
-            text-align: center;
-        }}
-        .summary-card .value {{
-            font-size: 2.5em;
-            font-weight: bold;
-            color: #667eea;
-            margin-bottom: 5px;
-        }}
-        .summary-card .label {{
-            color: #666;
-            font-size: 0.9em;
-        }}
-        .test-result {{
-            background: white;
-            padding: 25px;
-            border-radius: 10px;
-            margin-bottom: 20px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            border-left: 4px solid {success_color};
-        }}
-        .test-result.fail {{
-            border-left-color: {fail_color};
-        }}
-        .result-header {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 20px;
-        }}
-        .result-header h3 {{
-            color: #333;
-        }}
-        .status {{
-            font-size: 1.5em;
-        }}
-        .result-details {{
-            margin-top: 15px;
-        }}
-        .detail-row {{
-            display: flex;
-            justify-content: space-between;
-            padding: 8px 0;
-            border-bottom: 1px solid #eee;
-        }}
-        .detail-row:last-child {{
-            border-bottom: none;
-        }}
-        .label {{
-            font-weight: 600;
-            color: #666;
-        }}
-        .value {{
-            color: #333;
-        }}
-        .value.pass {{
-            color: {success_color};
-            font-weight: bold;
-        }}
-        .value.fail {{
-            color: {fail_color};
-            font-weight: bold;
-        }}
-        .errors-list {{
-            background: #fff3cd;
-            padding: 15px;
-            border-radius: 5px;
-            margin-top: 10px;
-        }}
-        .error-item {{
-            color: #856404;
-            padding: 5px 0;
-            padding-left: 20px;
-            position: relative;
-        }}
-        .error-item:before {{
-            content: "•";
-            position: absolute;
-            left: 5px;
-        }}
-        .error-message {{
-            color: {fail_color};
-            font-weight: 600;
-        }}
-        footer {{
-            text-align: center;
-            padding: 20px;
-            color: #666;
-            margin-top: 30px;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <header>
-            <h1>📱 Android App Automatic Test Report</h1>
-            <p>Generated on {report_data.test_date}</p>
-        </header>
-        
-        <div class="summary">
-            <h2>📊 Summary</h2>
-            {f'<p><strong>Device:</strong> {report_data.device_info}</p>' if report_data.device_info else ''}
-            <div class="summary-grid">
-                <div class="summary-card">
-                    <div class="value">{report_data.total_tests}</div>
-                    <div class="label">Total Tests</div>
-                </div>
-                <div class="summary-card">
-                    <div class="value" style="color: {success_color}">{report_data.successful_tests}</div>
-                    <div class="label">Successful ✅</div>
-                </div>
-                <div class="summary-card">
-                    <div class="value" style="color: {fail_color}">{report_data.failed_tests}</div>
-                    <div class="label">Failed ❌</div>
-                </div>
-                <div class="summary-card">
-                    <div class="value">{report_data.success_rate:.1f}%</div>
-                    <div class="label">Success Rate</div>
-                </div>
-                <div class="summary-card">
-                    <div class="value">{report_data.total_duration:.0f}s</div>
-                    <div class="label">Duration</div>
-                </div>
-            </div>
-        </div>
-        
-        <div class="test-results">
-            <h2 style="color: #667eea; margin-bottom: 20px;">📋 Test Results</h2>
-            {results_html}
-        </div>
-        
-        <footer>
-            <p>Generated by Android App Auto Tester</p>
-        </footer>
-    </div>
-</body>
-</html>
-"""
-        return html
+            """)
+
+            yield _HTML_RESULT_TEMPLATE.substitute(
+                app_name=app_name,
+                status_class=status_class,
+                status_icon="✅" if result.success else "❌",
+                status_text='PASS' if result.success else 'FAIL',
+                package=package,
+                duration=f"{result.duration:.2f}",
+                screens_visited=result.screens_visited,
+                elements_interacted=result.elements_interacted,
+                actions_count=len(result.actions_performed),
+                extras="".join(extras),
+            )
+
+        yield _HTML_TAIL
 
 
 def get_report_generator(output_dir: Optional[Path] = None) -> ReportGenerator:
@@ -5,9 +5,12 @@ Coordinates entire testing workflow.
 Integrates device management, UI exploration, and log collection.
 """
 
+import itertools
+import queue
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
 
@@ -23,10 +26,13 @@ from .exceptions import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     """
     Result of a single app test.
+
+    slots=True keeps per-instance storage compact; a long session can
+    accumulate one of these per app per retry.
     
     Attributes:
         app_name: App name that was tested
@@ -104,14 +110,41 @@ class TestEngine:
         self.settings = settings
         self.platform_utils = get_platform_utils()
 
+        # One date string per run plus a counter keeps screenshot names
+        # unique without a strftime call on every shot
+        self._run_date = time.strftime("%Y%m%d_%H%M%S")
+        self._shot_seq = itertools.count()
+
         # Initialize logger with session ID
-        session_id = f"test_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        self.logger = get_session_logger(__name__, session_id=session_id)
+        self.logger = get_session_logger(
+            __name__, session_id=f"test_{self._run_date}"
+        )
 
         # Initialize dependent components
         self.ui_explorer: Optional[UIExplorer] = None
         self.log_collector: Optional[LogCollector] = None
+
+        # Device info resolved once per run; dropped if the device
+        # disconnects (see _get_device_info_cached)
+        self._device_info_cache: Optional[DeviceInfo] = None
     
+    @contextmanager
+    def _warn_on_error(self, stage: str, exc_types=(Exception,)):
+        """
+        Run a block, logging listed exceptions as warnings.
+
+        Replaces the repeated try/except-log boilerplate around the
+        best-effort steps of a test attempt.
+
+        Args:
+            stage: What the block does, for the warning message
+            exc_types: Exception types to catch
+        """
+        try:
+            yield
+        except exc_types as e:
+            self.logger.warning(f"Failed to {stage}: {e}")
+
     def run_test(self, app_config: AppConfig) -> TestResult:
         """
         Run a test for a single app.
@@ -122,13 +155,19 @@ class TestEngine:
         Returns:
             TestResult: Test result
         """
-        self.logger.info("=" * 60)
-        self.logger.info(f"Testing: {app_config.name}")
-        self.logger.info(f"Package: {app_config.package}")
-        self.logger.info(f"Activity: {app_config.activity}")
-        self.logger.info(f"Duration: {app_config.test_duration}s")
-        self.logger.info(f"Actions: {', '.join(app_config.test_actions)}")
-        self.logger.info("=" * 60)
+        # One record per banner/summary block instead of one per line:
+        # each logging call formats and flushes through the handlers, so
+        # batching cuts that to a single write per block
+        bar = "=" * 60
+        self.logger.info("\n".join((
+            bar,
+            f"Testing: {app_config.name}",
+            f"Package: {app_config.package}",
+            f"Activity: {app_config.activity}",
+            f"Duration: {app_config.test_duration}s",
+            f"Actions: {', '.join(app_config.test_actions)}",
+            bar,
+        )))
         
         result = TestResult(
             app_name=app_config.name,
@@ -180,31 +219,52 @@ class TestEngine:
         result.duration = time.time() - start_time
         
         # Stop app
-        try:
+        with self._warn_on_error("stop app", (ADBError, DeviceError)):
             self.device_manager.stop_app(app_config.package)
-        except (ADBError, DeviceError) as e:
-            self.logger.warning(f"Error stopping app: {e}")
         
         # Print result summary
         self._print_test_summary(result)
         
         return result
     
-    def run_all_tests(self, app_configs: List[AppConfig]) -> List[TestResult]:
+    def run_all_tests(
+        self,
+        app_configs: List[AppConfig],
+        parallel_devices: bool = False
+    ) -> List[TestResult]:
         """
         Run tests for all configured apps.
-        
+
         Args:
             app_configs: List of app configurations to test
-        
+            parallel_devices: Distribute apps across all connected devices
+                instead of running sequentially on the caller's device
+
         Returns:
             List of TestResult objects
         """
         results = []
 
-        self.logger.info("=" * 60)
-        self.logger.info(f"Starting test run for {len(app_configs)} app(s)")
-        self.logger.info("=" * 60)
+        bar = "=" * 60
+        self.logger.info(
+            f"{bar}\nStarting test run for {len(app_configs)} app(s)\n{bar}"
+        )
+
+        # With several devices attached the run is wait-bound, not
+        # CPU-bound, so fan the apps out one engine per device -- but
+        # only when the caller asked for it, since it overrides any
+        # device selection made before this call
+        if parallel_devices:
+            try:
+                serials = [d.serial for d in self.device_manager.list_devices()]
+            except (DeviceError, ADBError) as e:
+                self.logger.warning(f"Device listing failed: {e}")
+                serials = []
+
+            if len(serials) > 1 and len(app_configs) > 1:
+                results = self._run_tests_parallel(app_configs, serials)
+                self._print_overall_summary(results)
+                return results
 
         for i, app_config in enumerate(app_configs, 1):
             
@@ -220,9 +280,71 @@ class TestEngine:
         
         # Print overall summary
         self._print_overall_summary(results)
-        
+
         return results
-    
+
+    def _run_tests_parallel(
+        self,
+        app_configs: List[AppConfig],
+        serials: List[str]
+    ) -> List[TestResult]:
+        """
+        Distribute tests across multiple connected devices.
+
+        Each device gets its own worker thread with a dedicated
+        DeviceManager and TestEngine; workers pull apps from a shared
+        queue until it is empty.  Output goes through the (thread-safe)
+        logger, so summaries do not interleave mid-line.
+
+        Args:
+            app_configs: List of app configurations to test
+            serials: Serial numbers of the devices to use
+
+        Returns:
+            List of TestResult objects (completion order)
+        """
+        self.logger.info(
+            f"Distributing {len(app_configs)} app(s) across "
+            f"{len(serials)} device(s)"
+        )
+
+        pending: queue.Queue = queue.Queue()
+        for app_config in app_configs:
+            pending.put(app_config)
+
+        def worker(serial: str) -> List[TestResult]:
+            manager = DeviceManager(serial)
+            if not manager.connect():
+                self.logger.warning(f"Could not connect to device {serial}")
+                return []
+
+            engine = TestEngine(manager, self.settings)
+            worker_results = []
+            try:
+                while True:
+                    try:
+                        app_config = pending.get_nowait()
+                    except queue.Empty:
+                        break
+
+                    worker_results.append(engine.run_test(app_config))
+
+                    # Per-worker gate, mirroring the sequential path
+                    if not pending.empty():
+                        time.sleep(self.settings.delay_between_apps)
+            finally:
+                manager.disconnect()
+
+            return worker_results
+
+        results = []
+        with ThreadPoolExecutor(max_workers=len(serials)) as pool:
+            futures = [pool.submit(worker, serial) for serial in serials]
+            for future in as_completed(futures):
+                results.extend(future.result())
+
+        return results
+
     def _run_test_attempt(
         self,
         app_config: AppConfig,
@@ -240,27 +362,28 @@ class TestEngine:
         Returns:
             bool: True if successful, False otherwise
         """
-        
-        
-        # Start app
-        if not self.device_manager.start_app(app_config.package, app_config.activity):
-            result.error_message = "Failed to start app"
-            
-            return False
-        
-        
-        
         # Initialize components
         self._initialize_components(app_config)
-        
-        # Start log collection (async)
-        try:
-            if self.settings.collect_logcat and self.log_collector:
-
 
+        # Start log collection before launching the app: the logcat
+        # process spins up on its own threads while the launch round-trip
+        # is in flight, and startup crashes land in the captured log
+        # instead of being missed
+        collecting = False
+        if self.settings.collect_logcat and self.log_collector:
+            with self._warn_on_error("start log collection",
+                                     (LogCollectionError,)):
                 self.log_collector.start_collection(app_config.test_duration)
-        except LogCollectionError as e:
-            self.logger.warning(f"Failed to start log collection: {e}")
+                collecting = True
+
+        # Start app
+        if not self.device_manager.start_app(app_config.package, app_config.activity):
+            result.error_message = "Failed to start app"
+            if collecting:
+                with self._warn_on_error("stop log collection",
+                                         (LogCollectionError,)):
+                    self.log_collector.stop_collection()
+            return False
 
         # Start UI exploration (blocks for duration)
         exploration_result = None
@@ -296,16 +419,15 @@ class TestEngine:
         
         # Stop log collection and get result
         log_result = None
-        try:
-            if self.settings.collect_logcat and self.log_collector:
+        if self.settings.collect_logcat and self.log_collector:
+            with self._warn_on_error("stop log collection",
+                                     (LogCollectionError,)):
                 self.logger.info("Stopping log collection")
                 log_result = self.log_collector.stop_collection()
                 result.log_file = log_result.log_file
                 # Add log errors if any
                 if log_result.error_count > 0:
                     result.errors_found.append(f"Logcat errors: {log_result.error_count}")
-        except LogCollectionError as e:
-            self.logger.warning(f"Failed to stop log collection: {e}")
         
         # Take final screenshot only if errors found
         if exploration_result and exploration_result.errors_found:
@@ -322,42 +444,64 @@ class TestEngine:
     
     def _initialize_components(self, app_config: AppConfig) -> None:
         """
-        Initialize UI explorer and log collector.
-        
+        Prepare the UI explorer and log collector for an app.
+
+        Both are built once and reused for the rest of the run; per-app
+        state is reconfigured instead of reconstructing the objects on
+        every attempt.
+
         Args:
             app_config: App configuration
         """
-        
-        
-        # Initialize UI explorer
+        # UI explorer: reuse while bound to the same device handle;
+        # explore() resets the visited-screen state on entry
         try:
-            if self.device_manager.device:
-                self.ui_explorer = UIExplorer(self.device_manager.device)
-
-            else:
-
+            device = self.device_manager.device
+            if device is None:
                 self.ui_explorer = None
+            elif (self.ui_explorer is None
+                    or self.ui_explorer.device is not device):
+                self.ui_explorer = UIExplorer(device)
         except (UIExplorationError, DeviceError) as e:
 
             self.ui_explorer = None
-        
-        # Initialize log collector
+
+        # Log collector: rebind the package filter instead of rebuilding
         try:
-            device_info = self.device_manager.get_device_info()
-            if device_info:
+            device_info = self._get_device_info_cached()
+            if device_info is None:
+                self.log_collector = None
+            elif (self.log_collector is None
+                    or self.log_collector.device_serial != device_info.serial):
                 self.log_collector = LogCollector(
                     device_info.serial,
                     log_filter=self.settings.logcat_filter,
                     package_filter=app_config.package
                 )
-
             else:
-
-                self.log_collector = None
+                self.log_collector.configure(
+                    package_filter=app_config.package
+                )
         except LogCollectionError as e:
 
             self.log_collector = None
     
+    def _get_device_info_cached(self) -> Optional[DeviceInfo]:
+        """
+        Get device info, reusing the value resolved for this run.
+
+        _initialize_components runs for every attempt of every app;
+        the device does not change mid-run, so query the manager once
+        and only re-resolve after a disconnect.
+
+        Returns:
+            DeviceInfo or None if unavailable
+        """
+        if (self._device_info_cache is None
+                or not self.device_manager.is_connected()):
+            self._device_info_cache = self.device_manager.get_device_info()
+        return self._device_info_cache
+
     def _take_screenshot(self, filename: str) -> Optional[Path]:
         """
         Take a screenshot with current timestamp.
@@ -372,8 +516,10 @@ class TestEngine:
             return None
         
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            full_filename = f"{filename}_{timestamp}.png"
+            # The counter also rules out same-second filename collisions
+            full_filename = (
+                f"{filename}_{self._run_date}_{next(self._shot_seq):05d}.png"
+            )
 
             return self.device_manager.take_screenshot(full_filename)
         except (DeviceError, ADBError) as e:
@@ -399,59 +545,67 @@ class TestEngine:
         return self._take_screenshot(filename)
     
     def _print_test_summary(self, result: TestResult) -> None:
-        """Print test result summary."""
-        self.logger.info("=" * 60)
-        self.logger.info(f"Test Summary: {result.app_name}")
-        self.logger.info("=" * 60)
-        self.logger.info(f"Status: {'✅ SUCCESS' if result.success else '❌ FAILED'}")
-        self.logger.info(f"Duration: {result.duration:.2f}s")
-        self.logger.info(f"Retry Count: {result.retry_count}")
-        self.logger.info(f"Screens Visited: {result.screens_visited}")
-        self.logger.info(f"Elements Interacted: {result.elements_interacted}")
-        self.logger.info(f"Actions Performed: {len(result.actions_performed)}")
-        
+        """Print test result summary as a single log record."""
+        bar = "=" * 60
+        lines = [
+            bar,
+            f"Test Summary: {result.app_name}",
+            bar,
+            f"Status: {'✅ SUCCESS' if result.success else '❌ FAILED'}",
+            f"Duration: {result.duration:.2f}s",
+            f"Retry Count: {result.retry_count}",
+            f"Screens Visited: {result.screens_visited}",
+            f"Elements Interacted: {result.elements_interacted}",
+            f"Actions Performed: {len(result.actions_performed)}",
+        ]
+        append = lines.append
+
         if result.errors_found:
-            self.logger.info(f"Errors Found ({len(result.errors_found)}):")
+            append(f"Errors Found ({len(result.errors_found)}):")
             for error in result.errors_found[:5]:  # Show first 5
-                self.logger.info(f"  - {error}")
+                append(f"  - {error}")
             if len(result.errors_found) > 5:
-                self.logger.info(f"  ... and {len(result.errors_found) - 5} more")
-        
+                append(f"  ... and {len(result.errors_found) - 5} more")
+
         if result.log_file:
-            self.logger.info(f"Log File: {result.log_file}")
-        
+            append(f"Log File: {result.log_file}")
+
         if result.screenshot_files:
-            self.logger.info(f"Screenshots ({len(result.screenshot_files)}):")
+            append(f"Screenshots ({len(result.screenshot_files)}):")
             for screenshot in result.screenshot_files:
-                self.logger.info(f"  - {screenshot}")
-        
+                append(f"  - {screenshot}")
+
         if result.error_message:
-            self.logger.info(f"Error: {result.error_message}")
+            append(f"Error: {result.error_message}")
+
+        append(bar)
+        self.logger.info("\n".join(lines))
 
-        self.logger.info("=" * 60)
-    
     def _print_overall_summary(self, results: List[TestResult]) -> None:
-        """Print overall test run summary."""
-        self.logger.info("=" * 60)
-        self.logger.info("Overall Test Summary")
-        self.logger.info("=" * 60)
-        
+        """Print overall test run summary as a single log record."""
         total = len(results)
         successful = sum(1 for r in results if r.success)
         failed = total - successful
-        
-        self.logger.info(f"Total Tests: {total}")
-        self.logger.info(f"Successful: {successful} ✅")
-        self.logger.info(f"Failed: {failed} ❌")
-        
+
+        bar = "=" * 60
+        lines = [
+            bar,
+            "Overall Test Summary",
+            bar,
+            f"Total Tests: {total}",
+            f"Successful: {successful} ✅",
+            f"Failed: {failed} ❌",
+        ]
+
         if total > 0:
             success_rate = (successful / total) * 100
-            self.logger.info(f"Success Rate: {success_rate:.1f}%")
-        
+            lines.append(f"Success Rate: {success_rate:.1f}%")
+
         total_duration = sum(r.duration for r in results)
-        self.logger.info(f"Total Duration: {total_duration:.2f}s")
+        lines.append(f"Total Duration: {total_duration:.2f}s")
 
-        self.logger.info("=" * 60)
+        lines.append(bar)
+        self.logger.info("\n".join(lines))
 
 
 def get_test_engine(
@@ -403,6 +403,52 @@ class TestLogCollector:
         
         print("✓ LogCollector analyze_logs test passed")
     
+    def test_analyze_file(self):
+        """Test analyze_file method and its chunk boundary math."""
+        import tempfile
+        import os
+        from src.log_collector import _analyze_chunk
+
+        collector = LogCollector("TEST123")
+
+        # Build a small threadtime-style log file
+        lines = [
+            f"01-02 12:34:56.{i:03d}  1234  5678 "
+            f"{'EWI'[i % 3]} Tag{i % 3}: message {i}\n"
+            for i in range(10)
+        ]
+        data = "".join(lines).encode('utf-8')
+
+        with tempfile.NamedTemporaryFile(
+            mode='wb', suffix=".log", delete=False
+        ) as f:
+            f.write(data)
+            log_path = Path(f.name)
+
+        try:
+            stats = collector.analyze_file(log_path)
+
+            assert stats["total"] == 10
+            assert stats["by_level"]["E"] == 4
+            assert stats["by_level"]["W"] == 3
+            assert stats["by_level"]["I"] == 3
+            assert stats["error_count"] == 4
+            assert stats["warning_count"] == 3
+            assert stats["by_tag"]["Tag0"] == 4
+
+            # Chunk ownership: no line may be dropped or double-counted
+            # wherever the split lands, including exactly on a line start
+            line_start = len(lines[0]) * 5
+            for boundary in (line_start, line_start - 3, line_start + 3, 1):
+                first = _analyze_chunk((log_path, 0, boundary))
+                second = _analyze_chunk((log_path, boundary, len(data)))
+                merged = first[0] + second[0]
+                assert sum(merged.values()) == 10, boundary
+        finally:
+            os.unlink(log_path)
+
+        print("✓ LogCollector analyze_file test passed")
+
     def test_extract_package(self):
         """Test _extract_package method."""
         collector = LogCollector("TEST123")
@@ -456,6 +502,7 @@ def run_all_tests():
     test_log_collector.test_get_errors()
     test_log_collector.test_get_warnings()
     test_log_collector.test_analyze_logs()
+    test_log_collector.test_analyze_file()
     test_log_collector.test_extract_package()
     print()
     